@@ -8,11 +8,13 @@ import asyncio
 import configparser
 import logging
 from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import cast
 
 import darkdetect
 from PySide6.QtCore import QMutex, QMutexLocker, QObject, Signal
+from skyfield.units import Angle
 
 from ndastro.libs.utils import ensure_event_loop
 
@@ -171,6 +173,21 @@ class SettingsManager:
                 task.add_done_callback(self._background_tasks.discard)
             return value
 
+    def location_angles(self) -> tuple[Angle, Angle]:
+        """Retrieve the configured location as latitude and longitude angles.
+
+        Returns
+        -------
+        tuple[Angle, Angle]
+            The latitude and longitude of the "location" setting.
+
+        Notes
+        -----
+        The parsed angles are memoized on the setting's text, so a changed location is picked up on the next call.
+
+        """
+        return _parse_location(self.get("APP", "location"))
+
     async def set_async(self, section: str, key: str, value: object) -> None:
         """Asynchronously set a configuration value for a given section and key.
 
@@ -249,3 +266,10 @@ class SettingsManager:
                     self.config_parser[section][key] = str(value)
             await self.save()
             self._logger.info("All settings saved to %s", self._config_file)
+
+
+@lru_cache(maxsize=8)
+def _parse_location(location: str) -> tuple[Angle, Angle]:
+    """Return the latitude and longitude angles of a "lat,lon" location setting, memoized per setting text."""
+    lat, lon = (float(coord) for coord in location.split(","))
+    return Angle(degrees=lat), Angle(degrees=lon)
@@ -5,11 +5,15 @@ Include attributes such as name, description, cycle years, and a mapping of plan
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
     from ndastro.libs.planet_enum import Planets
 
 
@@ -38,11 +42,12 @@ class DashaTypes(Enum):
         return self.name.capitalize()
 
 
-@dataclass
+@dataclass(frozen=True)
 class DashaDetail:
     """Defines the DashaSystem class.
 
     Represents a system of dasha periods with associated attributes such as name, description, and available systems.
+    Instances are frozen so the period data derived in __post_init__ can't go stale.
     """
 
     name: str
@@ -55,3 +60,21 @@ class DashaDetail:
     """The total number of years in the dasha cycle."""
     planets_period: dict[Planets, int] | None = None
     """A dictionary mapping planet names to their respective periods in the dasha cycle."""
+    planets_order: tuple[Planets, ...] = field(init=False, default=())
+    """The planets in the order their periods run in the dasha cycle."""
+    period_days: tuple[int, ...] = field(init=False, default=())
+    """The length in days of each planet's period, aligned with planets_order."""
+    period_ends: NDArray[np.int64] = field(init=False, repr=False, compare=False)
+    """The cumulative day on which each planet's period ends, aligned with planets_order; derived, so left out of comparisons."""
+    cycle_days: int = field(init=False, default=0)
+    """The total number of days in the dasha cycle."""
+
+    def __post_init__(self) -> None:
+        """Derive the ordered planet and period data from planets_period and cycle_years."""
+        # A year is counted as 365 days, ignoring leap days; moving to 365.25 would shift every period boundary, so it is
+        # left for a follow-up that can re-check the expected dashas
+        if self.planets_period:
+            object.__setattr__(self, "planets_order", tuple(self.planets_period))
+            object.__setattr__(self, "period_days", tuple(years * 365 for years in self.planets_period.values()))
+        object.__setattr__(self, "period_ends", np.cumsum(np.array(self.period_days, dtype=np.int64)))
+        object.__setattr__(self, "cycle_days", self.cycle_years * 365)
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
     from skyfield.units import Angle
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     from ndastro.libs.rasi_enum import Rasis
 
 
-@dataclass
+@dataclass(slots=True)
 class Kattam:
     """Holds data for each square (kattam/கட்டம்) on the chart."""
 
@@ -25,3 +25,9 @@ class Kattam:
     rasi: Rasis
     house: Houses
     planets: list[PlanetDetail] | None
+    sorted_planets: tuple[PlanetDetail, ...] = field(init=False, default=())
+
+    def __post_init__(self) -> None:
+        """Order the planets by how far they have advanced within the rasi."""
+        if self.planets:
+            self.sorted_planets = tuple(sorted(self.planets, key=lambda p: cast("float", cast("Angle", p.advanced_by).degrees)))
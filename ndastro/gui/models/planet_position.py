@@ -15,7 +15,7 @@ if TYPE_CHECKING:
     from ndastro.libs.rasi_enum import Rasis
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanetDetail:
     """Represents the position of a planet with various attributes.
 
@@ -1,6 +1,10 @@
 """Module to hold ND Astro app."""
 
+from functools import lru_cache
+
+from PySide6.QtCore import QFile, QTextStream
 from PySide6.QtWidgets import QApplication
+from qdarkstyle import DarkPalette, LightPalette, load_stylesheet
 
 
 class NDAstro(QApplication):
@@ -10,3 +14,31 @@ class NDAstro(QApplication):
         QApplication (_type_): The application
 
     """
+
+
+@lru_cache(maxsize=4)
+def combined_stylesheet(theme: str) -> str:
+    """Return the qdarkstyle stylesheet for the theme followed by the app's own stylesheet, memoized per theme.
+
+    Args:
+        theme (str): The theme, either "dark" or "light"
+
+    Returns:
+        str: The stylesheet to set on the application
+
+    """
+    palette = DarkPalette if theme == "dark" else LightPalette
+
+    return load_stylesheet(qt_api="pyside6", palette=palette) + _core_stylesheet()
+
+
+@lru_cache(maxsize=1)
+def _core_stylesheet() -> str:
+    """Return the app's own stylesheet from the compiled Qt resources, read once."""
+    file = QFile(":/styles/core.qss")
+    file.open(QFile.OpenModeFlag.ReadOnly | QFile.OpenModeFlag.Text)
+    stream = QTextStream(file)
+    stylesheet = stream.readAll()
+    file.close()
+
+    return stylesheet
@@ -11,6 +11,7 @@ from PySide6.QtWidgets import QApplication
 if TYPE_CHECKING:
     from ndastro.core.settings.manager import SettingsManager
 
+from ndastro.gui.ndastro import combined_stylesheet
 from ndastro.libs.utils import get_kattams
 
 if TYPE_CHECKING:
@@ -18,8 +19,6 @@ if TYPE_CHECKING:
     from ndastro.gui.models.ndastro_model import NDAstroModel
     from ndastro.gui.ndastro import NDAstro
 
-from qdarkstyle import DarkPalette, LightPalette, load_stylesheet
-
 
 class NDAstroViewModel(QObject):
     """ViewModel to hold data & business.
@@ -141,8 +140,7 @@ class NDAstroViewModel(QObject):
         if app is None:
             raise RuntimeError
 
-        palette = DarkPalette if theme[1] == "dark" else LightPalette
-        cast("NDAstro", app).setStyleSheet(load_stylesheet(qt_api="pyside6", palette=palette))
+        cast("NDAstro", app).setStyleSheet(combined_stylesheet(theme[1]))
 
         await self._settings_manager.set_async("APP", "theme", theme[1])
         self.theme_changed.emit(theme[1])
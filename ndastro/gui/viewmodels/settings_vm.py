@@ -83,6 +83,18 @@ class SettingsViewModel:
             self.settings[section] = {}
         self.settings[section][key] = str(value)
 
+    def set_many(self, values: dict[tuple[str, str], str]) -> None:
+        """Set several values in the settings dictionary in one call.
+
+        Parameters
+        ----------
+        values : dict[tuple[str, str], str]
+            The values to set, keyed by (section, key).
+
+        """
+        for (section, key), value in values.items():
+            self.settings.setdefault(section, {})[key] = str(value)
+
     # Convenience methods (optional)
     def get_bool(self, section: str, key: str, *, default: bool = False) -> bool:
         """Retrieve a boolean setting value from the settings dictionary.
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import cast
+from typing import ClassVar, cast
 
 from PySide6.QtCore import QPoint, QRect, QSize
 from PySide6.QtWidgets import (
@@ -24,6 +24,8 @@ class HoverableTextItem(QGraphicsTextItem):
 
     """
 
+    _shared_popup: ClassVar[CustomPopup | None] = None
+
     def __init__(self, text: str, parent: QGraphicsItem | None) -> None:
         """Initialize the hoverable text.
 
@@ -43,9 +45,12 @@ class HoverableTextItem(QGraphicsTextItem):
             event (QGraphicsSceneHoverEvent): _description_
 
         """
-        # Create and show the popup
-        if not self.popup:
-            self.popup = CustomPopup(self.toPlainText(), None)
+        # Only one popup is visible at a time, so every item shares the same one
+        if HoverableTextItem._shared_popup is None:
+            HoverableTextItem._shared_popup = CustomPopup(self.toPlainText(), None)
+        else:
+            HoverableTextItem._shared_popup.set_text(self.toPlainText())
+        self.popup = HoverableTextItem._shared_popup
 
         self.show_smart_popup(event.screenPos())
 
@@ -1,10 +1,13 @@
 """ND Astro module."""
 
 import asyncio
+from collections.abc import Coroutine
+from functools import lru_cache
+from typing import Any
 
 from dependency_injector.wiring import Provide, inject
 from i18n.translator import t
-from PySide6.QtCore import Slot
+from PySide6.QtCore import QTimer, Slot
 from PySide6.QtGui import QAction, QIcon
 from PySide6.QtWidgets import (
     QComboBox,
@@ -28,38 +31,93 @@ from ndastro.gui.views.widgets.resizable_chart import ResizableAstroChart
 from ndastro.gui.views.widgets.settings import SettingsDialog
 
 
+@lru_cache(maxsize=64)
+def _micon(name: str) -> QIcon:
+    """Return the material icon for the given name, built once and shared across actions."""
+    return QIcon(MaterialIcon(name))
+
+
 class NDAstroMainWindow(QMainWindow):
     """Module providing a function printing python version."""
 
+    # (menu attribute, title key) pairs used when retranslating the menu bar
+    _MENU_TRANSLATIONS: tuple[tuple[str, str], ...] = (
+        ("file_menu", "common.menus.file.title"),
+        ("edit_menu", "common.menus.edit.title"),
+        ("view_menu", "common.menus.view.title"),
+        ("tools_menu", "common.menus.tools.title"),
+        ("help_menu", "common.menus.help.title"),
+    )
+
+    # (action attribute, text key, tooltip key) triples used when retranslating the actions
+    _ACTION_TRANSLATIONS: tuple[tuple[str, str, str | None], ...] = (
+        ("new_action", "common.menus.file.new", "common.menus.file.new.tooltip"),
+        ("open_action", "common.menus.file.open", "common.menus.file.open.tooltip"),
+        ("save_action", "common.menus.file.save", "common.menus.file.save.tooltip"),
+        ("save_as_action", "common.menus.file.saveAs", "common.menus.file.saveAs.tooltip"),
+        ("exit_action", "common.menus.file.exit", "common.menus.file.exit.tooltip"),
+        ("undo_action", "common.menus.edit.undo", "common.menus.edit.undo.tooltip"),
+        ("redo_action", "common.menus.edit.redo", "common.menus.edit.redo.tooltip"),
+        ("cut_action", "common.menus.edit.cut", "common.menus.edit.cut.tooltip"),
+        ("copy_action", "common.menus.edit.copy", "common.menus.edit.copy.tooltip"),
+        ("paste_action", "common.menus.edit.paste", "common.menus.edit.paste.tooltip"),
+        ("delete_action", "common.menus.edit.delete", "common.menus.edit.delete.tooltip"),
+        ("select_all_action", "common.menus.edit.selectAll", "common.menus.edit.selectAll.tooltip"),
+        ("zoom_in_action", "common.menus.view.zoomIn", "common.menus.view.zoomIn.tooltip"),
+        ("zoom_out_action", "common.menus.view.zoomOut", "common.menus.view.zoomOut.tooltip"),
+        ("reset_zoom_action", "common.menus.view.resetZoom", None),
+        ("fullscreen_action", "common.menus.view.fullscreen", "common.menus.view.fullscreen.tooltip"),
+        ("settings_action", "common.menus.tools.settings", "common.menus.tools.settings.tooltip"),
+        ("preferences_action", "common.menus.tools.preferences", "common.menus.tools.preferences.tooltip"),
+        ("extensions_action", "common.menus.tools.extensions", "common.menus.tools.extensions.tooltip"),
+        ("plugins_action", "common.menus.tools.plugins", "common.menus.tools.plugins.tooltip"),
+        ("documentation_action", "common.menus.help.documentation", "common.menus.help.documentation.tooltip"),
+        ("support_action", "common.menus.help.support", "common.menus.help.support.tooltip"),
+        ("check_for_updates_action", "common.menus.help.checkForUpdates", "common.menus.help.checkForUpdates.tooltip"),
+        ("about_action", "common.menus.help.about", "common.menus.help.about.tooltip"),
+    )
+
     def __init__(self, view_model: NDAstroViewModel, settings_manager: SettingsManager) -> None:
         """Initialize the app."""
         super().__init__()
         self._view_model = view_model
         self._settings_manager = settings_manager
+        self._background_tasks: set[asyncio.Task[None]] = set()
+        self._app_settings = {key: self._settings_manager.get("APP", key) for key in ("language", "theme")}
 
-        self._view_model.language_changed.connect(self._set_language)
+        self._settings_manager.notifier.setting_changed.connect(self._on_setting_changed)
 
         self.init_ui()
 
     def init_ui(self) -> None:
-        """Initialize the UI."""
+        """Initialize the UI.
+
+        Only the window frame and the chart are built before the first paint; actions,
+        menus and the toolbar are created on the next event loop tick.
+        """
         self._setup_window()
         self._setup_layout()
-        self._setup_toolbar()
         self._setup_central_widget()
         self.show()
 
-    def _setup_window(self) -> None:
-        """Set up the main window properties."""
+        QTimer.singleShot(0, self._finish_init)
+
+    def _finish_init(self) -> None:
+        """Create the actions, menus and toolbar deferred from init_ui."""
         self._create_actions()
         self._create_menus()
+        self._setup_toolbar()
+
+        # Retranslating touches the menus and actions, so only listen for language changes once they exist
+        self._view_model.language_changed.connect(self._set_language)
 
+    def _setup_window(self) -> None:
+        """Set up the main window properties."""
         self.setWindowTitle(self._view_model.title)
 
     def _setup_layout(self) -> None:
         """Set up the main layout."""
         self.h_layout = QHBoxLayout()
-        self.setLayout(self.h_layout)
 
         self.vl_left_frame = QVBoxLayout()
 
@@ -97,20 +155,17 @@ class NDAstroMainWindow(QMainWindow):
 
         self.setCentralWidget(container)
 
-        self.show()
-
     def _create_language_selector(self) -> QComboBox:
         """Create language selector."""
         combo = QComboBox()
         options = self._view_model.locales
-        for _, (text, _) in enumerate(options):
-            combo.addItem(text)
+        combo.addItems([text for text, _ in options])
 
-        language = self._settings_manager.get("APP", "language")
-        language_index = options.index(next(filter(lambda x: x[1] == language, options), options[0]))
-        combo.setCurrentIndex(language_index)
+        language = self._app_settings["language"]
+        language_to_index = {code: index for index, (_, code) in enumerate(options)}
+        combo.setCurrentIndex(language_to_index.get(language, 0))
 
-        combo.currentIndexChanged.connect(lambda index: asyncio.create_task(self._view_model.set_language(index)))
+        combo.currentIndexChanged.connect(self._on_language_changed)
 
         return combo
 
@@ -118,83 +173,49 @@ class NDAstroMainWindow(QMainWindow):
         """Create theme selector."""
         combo = QComboBox()
         options = self._view_model.themes
-        for _, (text, _) in enumerate(options):
-            combo.addItem(text)
+        combo.addItems([text for text, _ in options])
 
-        theme = self._settings_manager.get("APP", "theme")
-        theme_index = options.index(next(filter(lambda x: x[1] == theme, options), options[0]))
-        combo.setCurrentIndex(theme_index)
+        theme = self._app_settings["theme"]
+        theme_to_index = {code: index for index, (_, code) in enumerate(options)}
+        combo.setCurrentIndex(theme_to_index.get(theme, 0))
 
-        combo.currentIndexChanged.connect(lambda index: asyncio.create_task(self._view_model.set_theme(index)))
+        combo.currentIndexChanged.connect(self._on_theme_changed)
 
         return combo
 
+    @Slot(int)
+    def _on_language_changed(self, index: int) -> None:
+        self._run_task(self._view_model.set_language(index))
+
+    @Slot(int)
+    def _on_theme_changed(self, index: int) -> None:
+        self._run_task(self._view_model.set_theme(index))
+
+    @Slot(str, str, str)
+    def _on_setting_changed(self, section: str, key: str, value: str) -> None:
+        if section == "APP" and key in self._app_settings:
+            self._app_settings[key] = value
+
+    def _run_task(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Schedule the coroutine, keeping a reference so the task is not garbage collected."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     def _set_language(self) -> None:
         self._retranslate_ui()
 
     def _retranslate_ui(self) -> None:
-        self._retranslate_menu_titles()
-        self._retranslate_action_texts()
-        self._retranslate_action_tooltips()
-
-    def _retranslate_menu_titles(self) -> None:
         self.setWindowTitle(t("common.appTitle"))
-        self.file_menu.setTitle(t("common.menus.file.title"))
-        self.edit_menu.setTitle(t("common.menus.edit.title"))
-        self.view_menu.setTitle(t("common.menus.view.title"))
-        self.tools_menu.setTitle(t("common.menus.tools.title"))
-        self.help_menu.setTitle(t("common.menus.help.title"))
-
-    def _retranslate_action_texts(self) -> None:
-        self.new_action.setText(t("common.menus.file.new"))
-        self.open_action.setText(t("common.menus.file.open"))
-        self.save_action.setText(t("common.menus.file.save"))
-        self.save_as_action.setText(t("common.menus.file.saveAs"))
-        self.exit_action.setText(t("common.menus.file.exit"))
-        self.undo_action.setText(t("common.menus.edit.undo"))
-        self.redo_action.setText(t("common.menus.edit.redo"))
-        self.cut_action.setText(t("common.menus.edit.cut"))
-        self.copy_action.setText(t("common.menus.edit.copy"))
-        self.paste_action.setText(t("common.menus.edit.paste"))
-        self.delete_action.setText(t("common.menus.edit.delete"))
-        self.select_all_action.setText(t("common.menus.edit.selectAll"))
-        self.zoom_in_action.setText(t("common.menus.view.zoomIn"))
-        self.zoom_out_action.setText(t("common.menus.view.zoomOut"))
-        self.reset_zoom_action.setText(t("common.menus.view.resetZoom"))
-        self.fullscreen_action.setText(t("common.menus.view.fullscreen"))
-        self.settings_action.setText(t("common.menus.tools.settings"))
-        self.preferences_action.setText(t("common.menus.tools.preferences"))
-        self.extensions_action.setText(t("common.menus.tools.extensions"))
-        self.plugins_action.setText(t("common.menus.tools.plugins"))
-        self.documentation_action.setText(t("common.menus.help.documentation"))
-        self.support_action.setText(t("common.menus.help.support"))
-        self.check_for_updates_action.setText(t("common.menus.help.checkForUpdates"))
-        self.about_action.setText(t("common.menus.help.about"))
-
-    def _retranslate_action_tooltips(self) -> None:
-        self.new_action.setToolTip(t("common.menus.file.new.tooltip"))
-        self.open_action.setToolTip(t("common.menus.file.open.tooltip"))
-        self.save_action.setToolTip(t("common.menus.file.save.tooltip"))
-        self.save_as_action.setToolTip(t("common.menus.file.saveAs.tooltip"))
-        self.exit_action.setToolTip(t("common.menus.file.exit.tooltip"))
-        self.undo_action.setToolTip(t("common.menus.edit.undo.tooltip"))
-        self.redo_action.setToolTip(t("common.menus.edit.redo.tooltip"))
-        self.cut_action.setToolTip(t("common.menus.edit.cut.tooltip"))
-        self.copy_action.setToolTip(t("common.menus.edit.copy.tooltip"))
-        self.paste_action.setToolTip(t("common.menus.edit.paste.tooltip"))
-        self.delete_action.setToolTip(t("common.menus.edit.delete.tooltip"))
-        self.select_all_action.setToolTip(t("common.menus.edit.selectAll.tooltip"))
-        self.zoom_in_action.setToolTip(t("common.menus.view.zoomIn.tooltip"))
-        self.zoom_out_action.setToolTip(t("common.menus.view.zoomOut.tooltip"))
-        self.fullscreen_action.setToolTip(t("common.menus.view.fullscreen.tooltip"))
-        self.settings_action.setToolTip(t("common.menus.tools.settings.tooltip"))
-        self.preferences_action.setToolTip(t("common.menus.tools.preferences.tooltip"))
-        self.extensions_action.setToolTip(t("common.menus.tools.extensions.tooltip"))
-        self.plugins_action.setToolTip(t("common.menus.tools.plugins.tooltip"))
-        self.documentation_action.setToolTip(t("common.menus.help.documentation.tooltip"))
-        self.support_action.setToolTip(t("common.menus.help.support.tooltip"))
-        self.check_for_updates_action.setToolTip(t("common.menus.help.checkForUpdates.tooltip"))
-        self.about_action.setToolTip(t("common.menus.help.about.tooltip"))
+
+        for menu_name, title_key in self._MENU_TRANSLATIONS:
+            getattr(self, menu_name).setTitle(t(title_key))
+
+        for action_name, text_key, tooltip_key in self._ACTION_TRANSLATIONS:
+            action = getattr(self, action_name)
+            action.setText(t(text_key))
+            if tooltip_key:
+                action.setToolTip(t(tooltip_key))
 
     def _create_menus(self) -> None:
         """Create the application menus."""
@@ -207,49 +228,35 @@ class NDAstroMainWindow(QMainWindow):
     def _create_file_menu(self) -> None:
         """Create the File menu."""
         self.file_menu = self.menuBar().addMenu(t("common.menus.file.title"))
-        self.file_menu.addAction(self.new_action)
-        self.file_menu.addAction(self.open_action)
-        self.file_menu.addAction(self.save_action)
-        self.file_menu.addAction(self.save_as_action)
+        self.file_menu.addActions([self.new_action, self.open_action, self.save_action, self.save_as_action])
         self.file_menu.addSeparator()
         self.file_menu.addAction(self.exit_action)
 
     def _create_edit_menu(self) -> None:
         """Create the Edit menu."""
         self.edit_menu = self.menuBar().addMenu(t("common.menus.edit.title"))
-        self.edit_menu.addAction(self.undo_action)
-        self.edit_menu.addAction(self.redo_action)
+        self.edit_menu.addActions([self.undo_action, self.redo_action])
         self.edit_menu.addSeparator()
-        self.edit_menu.addAction(self.cut_action)
-        self.edit_menu.addAction(self.copy_action)
-        self.edit_menu.addAction(self.paste_action)
-        self.edit_menu.addAction(self.delete_action)
+        self.edit_menu.addActions([self.cut_action, self.copy_action, self.paste_action, self.delete_action])
         self.edit_menu.addSeparator()
         self.edit_menu.addAction(self.select_all_action)
 
     def _create_view_menu(self) -> None:
         """Create the View menu."""
         self.view_menu = self.menuBar().addMenu(t("common.menus.view.title"))
-        self.view_menu.addAction(self.zoom_in_action)
-        self.view_menu.addAction(self.zoom_out_action)
-        self.view_menu.addAction(self.reset_zoom_action)
+        self.view_menu.addActions([self.zoom_in_action, self.zoom_out_action, self.reset_zoom_action])
         self.view_menu.addSeparator()
         self.view_menu.addAction(self.fullscreen_action)
 
     def _create_tools_menu(self) -> None:
         """Create the Tools menu."""
         self.tools_menu = self.menuBar().addMenu(t("common.menus.tools.title"))
-        self.tools_menu.addAction(self.settings_action)
-        self.tools_menu.addAction(self.preferences_action)
-        self.tools_menu.addAction(self.extensions_action)
-        self.tools_menu.addAction(self.plugins_action)
+        self.tools_menu.addActions([self.settings_action, self.preferences_action, self.extensions_action, self.plugins_action])
 
     def _create_help_menu(self) -> None:
         """Create the Help menu."""
         self.help_menu = self.menuBar().addMenu(t("common.menus.help.title"))
-        self.help_menu.addAction(self.documentation_action)
-        self.help_menu.addAction(self.support_action)
-        self.help_menu.addAction(self.check_for_updates_action)
+        self.help_menu.addActions([self.documentation_action, self.support_action, self.check_for_updates_action])
         self.help_menu.addSeparator()
         self.help_menu.addAction(self.about_action)
 
@@ -263,85 +270,85 @@ class NDAstroMainWindow(QMainWindow):
 
     def _create_file_actions(self) -> None:
         """Create file-related actions."""
-        self.new_action = QAction(QIcon(MaterialIcon("add")), t("common.menus.file.new"), self)
+        self.new_action = QAction(_micon("add"), t("common.menus.file.new"), self)
         self.new_action.setShortcut("Ctrl+N")
         self.new_action.triggered.connect(self._new_file)
 
-        self.open_action = QAction(QIcon(MaterialIcon("folder_open")), t("common.menus.file.open"), self)
+        self.open_action = QAction(_micon("folder_open"), t("common.menus.file.open"), self)
         self.open_action.setShortcut("Ctrl+O")
         self.open_action.triggered.connect(self._open_file)
 
-        self.save_action = QAction(QIcon(MaterialIcon("save")), t("common.menus.file.save"), self)
+        self.save_action = QAction(_micon("save"), t("common.menus.file.save"), self)
         self.save_action.setShortcut("Ctrl+S")
         self.save_action.triggered.connect(self._save_file)
 
-        self.save_as_action = QAction(QIcon(MaterialIcon("save_as")), t("common.menus.file.saveAs"), self)
+        self.save_as_action = QAction(_micon("save_as"), t("common.menus.file.saveAs"), self)
         self.save_as_action.setShortcut("Ctrl+Shift+S")
         self.save_as_action.triggered.connect(self._save_as_file)
 
-        self.exit_action = QAction(QIcon(MaterialIcon("exit_to_app")), t("common.menus.file.exit"), self)
+        self.exit_action = QAction(_micon("exit_to_app"), t("common.menus.file.exit"), self)
         self.exit_action.setShortcut("Ctrl+X")
         self.exit_action.triggered.connect(self.close)
 
     def _create_edit_actions(self) -> None:
         """Create edit-related actions."""
-        self.undo_action = QAction(QIcon(MaterialIcon("undo")), t("common.menus.edit.undo"), self)
+        self.undo_action = QAction(_micon("undo"), t("common.menus.edit.undo"), self)
         self.undo_action.setShortcut("Ctrl+Z")
         self.undo_action.triggered.connect(self._undo)
 
-        self.redo_action = QAction(QIcon(MaterialIcon("redo")), t("common.menus.edit.redo"), self)
+        self.redo_action = QAction(_micon("redo"), t("common.menus.edit.redo"), self)
         self.redo_action.setShortcut("Ctrl+Y")
         self.redo_action.triggered.connect(self._redo)
 
-        self.cut_action = QAction(QIcon(MaterialIcon("content_cut")), t("common.menus.edit.cut"), self)
+        self.cut_action = QAction(_micon("content_cut"), t("common.menus.edit.cut"), self)
         self.cut_action.setShortcut("Ctrl+X")
         self.cut_action.triggered.connect(self._cut)
 
-        self.copy_action = QAction(QIcon(MaterialIcon("content_copy")), t("common.menus.edit.copy"), self)
+        self.copy_action = QAction(_micon("content_copy"), t("common.menus.edit.copy"), self)
         self.copy_action.setShortcut("Ctrl+C")
         self.copy_action.triggered.connect(self._copy)
 
-        self.paste_action = QAction(QIcon(MaterialIcon("content_paste")), t("common.menus.edit.paste"), self)
+        self.paste_action = QAction(_micon("content_paste"), t("common.menus.edit.paste"), self)
         self.paste_action.setShortcut("Ctrl+V")
         self.paste_action.triggered.connect(self._paste)
 
-        self.delete_action = QAction(QIcon(MaterialIcon("delete")), t("common.menus.edit.delete"), self)
+        self.delete_action = QAction(_micon("delete"), t("common.menus.edit.delete"), self)
         self.delete_action.triggered.connect(self._delete)
 
-        self.select_all_action = QAction(QIcon(MaterialIcon("select_all")), t("common.menus.edit.selectAll"), self)
+        self.select_all_action = QAction(_micon("select_all"), t("common.menus.edit.selectAll"), self)
         self.select_all_action.setShortcut("Ctrl+A")
         self.select_all_action.triggered.connect(self._select_all)
 
     def _create_view_actions(self) -> None:
         """Create view-related actions."""
-        self.zoom_in_action = QAction(QIcon(MaterialIcon("zoom_in")), t("common.menus.view.zoomIn"), self)
+        self.zoom_in_action = QAction(_micon("zoom_in"), t("common.menus.view.zoomIn"), self)
         self.zoom_in_action.setShortcut("Ctrl++")
         self.zoom_in_action.triggered.connect(self._zoom_in)
 
-        self.zoom_out_action = QAction(QIcon(MaterialIcon("zoom_out")), t("common.menus.view.zoomOut"), self)
+        self.zoom_out_action = QAction(_micon("zoom_out"), t("common.menus.view.zoomOut"), self)
         self.zoom_out_action.setShortcut("Ctrl+-")
         self.zoom_out_action.triggered.connect(self._zoom_out)
 
-        self.reset_zoom_action = QAction(QIcon(MaterialIcon("zoom_out_map")), t("common.menus.view.resetZoom"), self)
+        self.reset_zoom_action = QAction(_micon("zoom_out_map"), t("common.menus.view.resetZoom"), self)
         self.reset_zoom_action.setShortcut("Ctrl+0")
         self.reset_zoom_action.triggered.connect(self._reset_zoom)
 
-        self.fullscreen_action = QAction(QIcon(MaterialIcon("fullscreen")), t("common.menus.view.fullscreen"), self)
+        self.fullscreen_action = QAction(_micon("fullscreen"), t("common.menus.view.fullscreen"), self)
         self.fullscreen_action.setShortcut("F11")
         self.fullscreen_action.triggered.connect(self._toggle_fullscreen)
 
     def _create_tools_actions(self) -> None:
         """Create tools-related actions."""
-        self.settings_action = QAction(QIcon(MaterialIcon("settings")), t("common.menus.tools.settings"), self)
+        self.settings_action = QAction(_micon("settings"), t("common.menus.tools.settings"), self)
         self.settings_action.triggered.connect(self._open_settings)
 
-        self.preferences_action = QAction(QIcon(MaterialIcon("tune")), t("common.menus.tools.preferences"), self)
+        self.preferences_action = QAction(_micon("tune"), t("common.menus.tools.preferences"), self)
         self.preferences_action.triggered.connect(self._open_preferences)
 
-        self.extensions_action = QAction(QIcon(MaterialIcon("extension")), t("common.menus.tools.extensions"), self)
+        self.extensions_action = QAction(_micon("extension"), t("common.menus.tools.extensions"), self)
         self.extensions_action.triggered.connect(self._manage_extensions)
 
-        self.plugins_action = QAction(QIcon(MaterialIcon("widgets")), t("common.menus.tools.plugins"), self)
+        self.plugins_action = QAction(_micon("widgets"), t("common.menus.tools.plugins"), self)
         self.plugins_action.triggered.connect(self._manage_plugins)
 
     def _create_help_actions(self) -> None:
@@ -6,25 +6,28 @@ ascendants, and other astrological details.
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, cast
 
-from i18n import t
+from i18n import get
 from PySide6.QtCore import QRectF, Qt
 from PySide6.QtGui import QBrush, QFont, QPen
 from PySide6.QtWidgets import (
+    QGraphicsItem,
     QGraphicsLineItem,
     QGraphicsRectItem,
     QGraphicsScene,
-    QGraphicsTextItem,
+    QGraphicsSimpleTextItem,
     QGraphicsView,
 )
 
 from ndastro.core.settings.manager import SettingsManager
 from ndastro.gui.views.controls.hoverable_text import HoverableTextItem
+from ndastro.libs.i18n_cache import t
 from ndastro.libs.planet_enum import Planets
 
 if TYPE_CHECKING:
-    from PySide6.QtGui import QResizeEvent
+    from PySide6.QtGui import QResizeEvent, QShowEvent
     from skyfield.units import Angle
 
     from ndastro.gui.models.planet_position import PlanetDetail
@@ -32,6 +35,40 @@ if TYPE_CHECKING:
 
 from ndastro.libs.constants import KATTAM_RASI_MAP, SYMBOLS
 
+_RAISING_SIGN_KEY = "core.raising_sign"
+
+# The 12 outer cells of the 4x4 grid, row by row; the centre 2x2 is left empty
+_GRID_CELLS = tuple((row, col) for row in range(4) for col in range(4) if (row, col) not in {(1, 1), (1, 2), (2, 1), (2, 2)})
+
+
+@dataclass(slots=True)
+class _ChartCell:
+    """A grid cell of the chart together with the items drawn inside it."""
+
+    rect: QGraphicsRectItem
+    row: int
+    col: int
+    label: HoverableTextItem
+    planets: list[QGraphicsSimpleTextItem] = field(default_factory=list)
+    markers: list[tuple[QGraphicsSimpleTextItem, QGraphicsSimpleTextItem]] = field(default_factory=list)
+    lines: list[QGraphicsLineItem] = field(default_factory=list)
+
+
+def _shows_retrograde_marker(planet: PlanetDetail) -> bool:
+    """Return whether the planet's label carries the retrograde marker; Rahu and Kethu are always retrograde so never do."""
+    return planet.retrograde and planet.planet.code not in [Planets.RAHU.code, Planets.KETHU.code]
+
+
+def _planet_label(planet: PlanetDetail) -> str:
+    """Build the plain chart label of a planet for the active locale."""
+    return t(_RAISING_SIGN_KEY)[:3] if planet.is_ascendant else Planets.to_string(planet.planet)[:2]
+
+
+def _place_marker(label: QGraphicsSimpleTextItem, marker: QGraphicsSimpleTextItem) -> None:
+    """Position the retrograde marker as a subscript just after the label's text."""
+    label_br = label.boundingRect()
+    marker.setPos(label_br.width(), label_br.height() * 0.5)
+
 
 class ResizableAstroChart(QGraphicsView):
     """Resizable astro chart.
@@ -45,11 +82,25 @@ class ResizableAstroChart(QGraphicsView):
         """Resizable astro chart."""
         super().__init__()
         self.setScene(QGraphicsScene(self))
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing)
+        self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
         self._view_model = view_model
         self._settings_manager = settings_manager
         self.theme = self._settings_manager.get("APP", "theme")
         self._view_model.language_changed.connect(self._retranslate_ui)
         self._view_model.theme_changed.connect(self._update_theme)
+        self._cells: list[_ChartCell] = []
+        self._labels_locale: str | None = None
+        self._labels_theme: str | None = None
+        self._layout_size: tuple[int, int] | None = None
+
+        # Shared drawing resources, reused by every cell, line and planet label
+        self._planet_font = QFont()
+        self._planet_font.setBold(True)
+        self._planet_font.setPixelSize(20)
+        self._grid_pen = QPen(QBrush(Qt.GlobalColor.gray), 1, Qt.PenStyle.SolidLine, Qt.PenCapStyle.SquareCap)
+        self._lagna_pen = QPen(Qt.GlobalColor.red, 2)
 
         self.init_scene()
 
@@ -58,87 +109,94 @@ class ResizableAstroChart(QGraphicsView):
         # Draw the 4x4 grid
         square_size = 200  # 15 cm = 150 mm (scaled by 10 for simplicity)
 
-        count = 1
-        for row in range(4):
-            for col in range(4):
-                if (row, col) in [(1, 1), (1, 2), (2, 1), (2, 2)]:
-                    continue
-                x = col * square_size
-                y = row * square_size
-
-                # Create a square with a visible fill color
-                rect = QGraphicsRectItem(x, y, square_size, square_size)
-                brush = QBrush(Qt.GlobalColor.gray)
-                pen = QPen(brush, 1, Qt.PenStyle.SolidLine, Qt.PenCapStyle.SquareCap)
-                pen.setWidth(1)
-
-                rect.setPen(pen)
-
-                # Add a text label inside the square
-                kattam = self._view_model.kattams[KATTAM_RASI_MAP[count - 1] - 1] if self._view_model.kattams else None
-                text = HoverableTextItem(str(kattam.house.value) if kattam else "", None)
-                text.setDefaultTextColor(Qt.GlobalColor.black if self.theme == "light" else Qt.GlobalColor.white)
-                text.setScale(1.5)
-
-                width = rect.rect().width()
-                height = rect.rect().height()
-
-                if kattam and kattam.planets:
-                    sorted_planets = sorted(kattam.planets, key=lambda p: cast("float", cast("Angle", p.advanced_by).degrees))
-                    for i, planet in enumerate(sorted_planets):
-                        planet_name = QGraphicsTextItem()
-                        font = QFont()
-                        font.setBold(True)
-                        planet_name.setFont(font)
-                        planet_name.setHtml(
-                            f"<span>{planet.short_name}<sub>{SYMBOLS.RETROGRADE_SYMBOL if planet.retrograde else ''}</sub></span>",
-                        )
-                        planet_name.setData(1, planet)
-                        planet_name.setParentItem(rect)
-
-                        # Calculate position based on the rect x and sorted planet longitudes
-                        planet_x = x + ((cast("float", cast("Angle", planet.advanced_by).degrees) / 30) * (width - (width * 0.15)))
-                        planet_y = y + (0 if i % 2 == 0 else planet_name.boundingRect().height())
-                        planet_name.setPos(planet_x, planet_y)
-
-                if kattam is not None and kattam.is_ascendant is True:
-                    self.draw_lagna_lines(row, col, rect)
-
-                text.setParentItem(rect)  # Set rect as the parent
-
-                text.setPos(
-                    (col * width - 15)  # no of kattams already plotted left to right - some gap
-                    + width  # + the width of the current kattam
-                    - text.boundingRect().width(),  # - text width
-                    (row * height) + 30 - text.boundingRect().height(),  # no of kattams already plotted top to bottom - some gap - text height
-                )  # Position inside the square
-
-                self.scene().addItem(rect)
-
-                count += 1
+        for index, (row, col) in enumerate(_GRID_CELLS):
+            x = col * square_size
+            y = row * square_size
+
+            # Create a square with a visible fill color
+            rect = QGraphicsRectItem(x, y, square_size, square_size)
+            rect.setPen(self._grid_pen)
+            rect.setCacheMode(QGraphicsItem.CacheMode.ItemCoordinateCache)  # the outline only changes when the view is resized
+
+            # Add a text label inside the square
+            kattam = self._view_model.kattams[KATTAM_RASI_MAP[index] - 1] if self._view_model.kattams else None
+            text = HoverableTextItem(str(kattam.house.value) if kattam else "", None)
+            text.setDefaultTextColor(Qt.GlobalColor.black if self.theme == "light" else Qt.GlobalColor.white)
+            text.setScale(1.5)
+            text.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+            cell = _ChartCell(rect, row, col, text)
+
+            width = rect.rect().width()
+            height = rect.rect().height()
+
+            if kattam:
+                for i, planet in enumerate(kattam.sorted_planets):
+                    planet_name = QGraphicsSimpleTextItem(planet.short_name)
+                    planet_name.setFont(self._planet_font)
+                    planet_name.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)  # setText/color changes repaint it
+                    planet_name.setData(1, planet)
+                    planet_name.setParentItem(rect)
+
+                    if _shows_retrograde_marker(planet):
+                        # A small child item stands in for the subscript, so no rich text layout is needed
+                        marker = QGraphicsSimpleTextItem(SYMBOLS.RETROGRADE_SYMBOL, planet_name)
+                        marker.setFont(self._planet_font)
+                        marker.setScale(0.6)
+                        _place_marker(planet_name, marker)
+                        cell.markers.append((planet_name, marker))
+
+                    # Calculate position based on the rect x and sorted planet longitudes
+                    degrees = cast("float", cast("Angle", planet.advanced_by).degrees)
+                    planet_x = x + ((degrees / 30) * (width - (width * 0.15)))
+                    planet_y = y + (0 if i % 2 == 0 else planet_name.boundingRect().height())
+                    planet_name.setPos(planet_x, planet_y)
+                    cell.planets.append(planet_name)
+
+            if kattam is not None and kattam.is_ascendant is True:
+                cell.lines.extend(self.draw_lagna_lines(row, col, rect))
+
+            text.setParentItem(rect)  # Set rect as the parent
+
+            text.setPos(
+                (col * width - 15)  # no of kattams already plotted left to right - some gap
+                + width  # + the width of the current kattam
+                - text.boundingRect().width(),  # - text width
+                (row * height) + 30 - text.boundingRect().height(),  # no of kattams already plotted top to bottom - some gap - text height
+            )  # Position inside the square
+
+            self.scene().addItem(rect)
+            self._cells.append(cell)
 
         self.update_rects()
 
-    def draw_lagna_lines(self, row: int, col: int, rect: QGraphicsRectItem) -> None:
-        """Draw lagna lines on the specified rectangle."""
+    def draw_lagna_lines(self, row: int, col: int, rect: QGraphicsRectItem) -> tuple[QGraphicsLineItem, QGraphicsLineItem]:
+        """Draw lagna lines on the specified rectangle and return them."""
         bound = cast("QGraphicsRectItem", rect).boundingRect()
         lx = abs(bound.x() * col)
         ly = abs(bound.y() * row)
         line1 = QGraphicsLineItem(lx + 3, ly + bound.height() * 0.20, lx + bound.width() * 0.20, ly + 3)
         line1.setData(1, "first")
-        line1.setPen(QPen(Qt.GlobalColor.red, 2))
+        line1.setPen(self._lagna_pen)
         line1.setParentItem(rect)
 
         line2 = QGraphicsLineItem(lx + 3, ly + bound.height() * 0.22, lx + bound.width() * 0.22, ly + 3)
         line2.setData(1, "second")
-        line2.setPen(QPen(Qt.GlobalColor.red, 2))
+        line2.setPen(self._lagna_pen)
         line2.setParentItem(rect)  # Initial position and size adjustment
 
+        return line1, line2
+
     def resizeEvent(self, event: QResizeEvent) -> None:
         """Fire when the view is resized."""
         super().resizeEvent(event)
         self.update_scene_size()
-        self.update_rects()
+        self._reposition_items()
+
+    def showEvent(self, event: QShowEvent) -> None:  # noqa: N802
+        """Lay the chart out once it is shown, as resizes while hidden are skipped."""
+        super().showEvent(event)
+        self._reposition_items()
 
     def update_scene_size(self) -> None:
         """Update the scene size to match the view size."""
@@ -150,72 +208,97 @@ class ResizableAstroChart(QGraphicsView):
         )
 
     def update_rects(self) -> None:
-        """Resize and reposition rectangles based on the view size."""
-        view_width = self.viewport().width() - 1
-        view_height = self.viewport().height() - 1
+        """Refresh the labels, then resize and reposition rectangles based on the view size.
+
+        Each step is skipped when the locale, theme or viewport size it depends on is unchanged.
+        """
+        locale = get("locale")
+        if locale != self._labels_locale:
+            self._refresh_labels()
+            self._labels_locale = locale
+            self._layout_size = None  # label sizes changed, so positions must be recomputed
+
+        if self.theme != self._labels_theme:
+            self._apply_theme_colors()
+
+        self._reposition_items()
+
+    def _refresh_labels(self) -> None:
+        """Apply the current language to the planet labels."""
+        for cell in self._cells:
+            for child in cell.planets:
+                child.setText(_planet_label(cast("PlanetDetail", child.data(1))))
+            for label, marker in cell.markers:
+                _place_marker(label, marker)
+
+    def _apply_theme_colors(self) -> None:
+        """Apply the current theme's text color to the house numbers and planet labels."""
+        color = Qt.GlobalColor.black if self.theme == "light" else Qt.GlobalColor.white
+
+        brush = QBrush(color)
+
+        for cell in self._cells:
+            cell.label.setDefaultTextColor(color)
+            for child in cell.planets:
+                child.setBrush(brush)
+            for _, marker in cell.markers:
+                marker.setBrush(brush)
+
+        self._labels_theme = self.theme
+
+    def _reposition_items(self) -> None:
+        """Resize and reposition rectangles and their children based on the view size."""
+        size = (self.viewport().width(), self.viewport().height())
+        if size == self._layout_size:
+            return
+        if size[0] <= 1 or size[1] <= 1 or not self.isVisible():
+            return  # nothing sensible to lay out yet; showEvent or the next resize will
+
+        view_width = size[0] - 1
+        view_height = size[1] - 1
 
         # Example: evenly distribute the rectangles in the scene
         rect_width = view_width / 4  # 4 rects in a row
         rect_height = view_height / 4
 
-        for item in self.scene().items():
-            if isinstance(item, QGraphicsRectItem):
-                x = item.rect().x() // item.rect().width() * rect_width
-                y = item.rect().y() // item.rect().height() * rect_height
-                item.setRect(QRectF(x, y, rect_width, rect_height))
-
-                width = item.rect().width()
-                height = item.rect().height()
-
-                for child in item.childItems():
-                    if isinstance(child, HoverableTextItem):
-                        child.setDefaultTextColor(Qt.GlobalColor.black if self.theme == "light" else Qt.GlobalColor.white)
-                        child.setPos(
-                            (x + rect_width - child.boundingRect().width() - 15),
-                            (y + 30 - child.boundingRect().height()),
-                        )
-                    elif isinstance(child, QGraphicsLineItem):
-                        line = child
-
-                        if line.data(1) == "first":
-                            line.setLine(x + 3, y + item.boundingRect().height() * 0.20, x + item.boundingRect().width() * 0.20, y + 3)
-                        else:
-                            line.setLine(x + 3, y + item.boundingRect().height() * 0.22, x + item.boundingRect().width() * 0.22, y + 3)
-
-                # Get all QGraphicsTextItem from item.childItems()
-                planet_names = [child for child in item.childItems() if isinstance(child, QGraphicsTextItem)]
-                for i, planet_name in enumerate(planet_names):
-                    planet = cast("PlanetDetail", planet_name.data(1))
-                    if planet:
-                        # Calculate position based on the rect x and sorted planet longitudes
-                        t_width = planet_name.boundingRect().width()  # text width
-                        t_height = planet_name.boundingRect().height()  # text height
-                        per_width = (
-                            cast("float", cast("Angle", planet.advanced_by).degrees) / 30
-                        ) * width  # position based on the rect x and sorted planet longitudes
-                        actual_pos = x + per_width + t_width  # planet position in the rect + text width
-                        if_a_crosses_rect = actual_pos > (x + width)  # if planet crosses the rect
-                        planet_x = x + per_width - (actual_pos - (x + width) if if_a_crosses_rect else 0)  # planet position in the rect
-                        planet_y = y + height / 3 + (0 if i % 2 == 0 else t_height)
-
-                        font = QFont()
-                        font.setBold(True)
-                        font.setPixelSize(20)
-                        planet_name.setFont(font)
-                        planet_name.setDefaultTextColor(Qt.GlobalColor.black if self.theme == "light" else Qt.GlobalColor.white)
-                        planet_name.setHtml(
-                            f"<span>{t('core.raising_sign')[:3] if planet.is_ascendant else t(f'core.planets.planet{planet.planet.value}')[:2]} \
-                                <sub> \
-                                {
-                                SYMBOLS.RETROGRADE_SYMBOL
-                                if planet.retrograde and planet.planet.code not in [Planets.RAHU.code, Planets.KETHU.code]
-                                else ''
-                            }</sub></span>",
-                        )
-                        planet_name.setPos(
-                            planet_x,
-                            planet_y,
-                        )
+        for cell in self._cells:
+            x = cell.col * rect_width
+            y = cell.row * rect_height
+            cell.rect.setRect(QRectF(x, y, rect_width, rect_height))
+            item_br = cell.rect.boundingRect()
+
+            label_br = cell.label.boundingRect()
+            cell.label.setPos(
+                (x + rect_width - label_br.width() - 15),
+                (y + 30 - label_br.height()),
+            )
+
+            for line in cell.lines:
+                if line.data(1) == "first":
+                    line.setLine(x + 3, y + item_br.height() * 0.20, x + item_br.width() * 0.20, y + 3)
+                else:
+                    line.setLine(x + 3, y + item_br.height() * 0.22, x + item_br.width() * 0.22, y + 3)
+
+            for i, planet_name in enumerate(cell.planets):
+                planet = cast("PlanetDetail", planet_name.data(1))
+                # Calculate position based on the rect x and sorted planet longitudes
+                pbr = planet_name.boundingRect().united(planet_name.childrenBoundingRect())  # include any retrograde marker
+                t_width = pbr.width()  # text width
+                t_height = pbr.height()  # text height
+                per_width = (
+                    cast("float", cast("Angle", planet.advanced_by).degrees) / 30
+                ) * rect_width  # position based on the rect x and sorted planet longitudes
+                actual_pos = x + per_width + t_width  # planet position in the rect + text width
+                if_a_crosses_rect = actual_pos > (x + rect_width)  # if planet crosses the rect
+                planet_x = x + per_width - (actual_pos - (x + rect_width) if if_a_crosses_rect else 0)  # planet position in the rect
+                planet_y = y + rect_height / 3 + (0 if i % 2 == 0 else t_height)
+
+                planet_name.setPos(
+                    planet_x,
+                    planet_y,
+                )
+
+        self._layout_size = size
 
     def _retranslate_ui(self) -> None:
         self.update_rects()
@@ -223,5 +306,8 @@ class ResizableAstroChart(QGraphicsView):
     def _update_theme(self, theme: str) -> None:
         """Update the theme of the chart."""
         # Add logic to update the theme, e.g., changing colors or styles
+        if theme == self.theme == self._labels_theme:
+            return
+
         self.theme = theme
-        self.update_rects()
+        self._apply_theme_colors()
@@ -1,40 +1,38 @@
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QSignalBlocker
 from PySide6.QtWidgets import (
     QButtonGroup,
     QComboBox,
-    QLabel,
     QRadioButton,
-    QVBoxLayout,
-    QWidget,
 )
 
+from ndastro.gui.views.widgets.setting_sections.base_section import BaseSection
 
-class AppearanceSection(QWidget):
+_ACCENT_COLORS = ("Blue", "Red", "Green", "Purple", "Orange")
+_ACCENT_INDEX = {color: i for i, color in enumerate(_ACCENT_COLORS)}
+
+
+class AppearanceSection(BaseSection):
     def __init__(self, view_model):
         super().__init__()
         self.view_model = view_model
 
         # UI Elements
-        self.label_theme = QLabel("Theme:")
         self.radio_light = QRadioButton("Light")
         self.radio_dark = QRadioButton("Dark")
-        self.theme_group = QButtonGroup()
+        self.theme_group = QButtonGroup(self)
         self.theme_group.addButton(self.radio_light)
         self.theme_group.addButton(self.radio_dark)
 
-        self.label_accent = QLabel("Accent Color:")
         self.accent_combo = QComboBox()
-        self.accent_combo.addItems(["Blue", "Red", "Green", "Purple", "Orange"])
+        self.accent_combo.addItems(_ACCENT_COLORS)
 
         # Layout
-        layout = QVBoxLayout(self)
-        layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        layout.addWidget(self.label_theme)
-        layout.addWidget(self.radio_light)
-        layout.addWidget(self.radio_dark)
-        layout.addSpacing(10)
-        layout.addWidget(self.label_accent)
-        layout.addWidget(self.accent_combo)
+        self._build_form(
+            [
+                ("Theme:", (self.radio_light, self.radio_dark)),
+                ("Accent Color:", (self.accent_combo,)),
+            ],
+        )
 
         self._load()
 
@@ -44,20 +42,20 @@ class AppearanceSection(QWidget):
         self.accent_combo.currentTextChanged.connect(self._update)
 
     def _load(self):
-        theme = self.view_model.get("Appearance", "theme", "Light")
-        if theme.lower() == "dark":
-            self.radio_dark.setChecked(True)
-        else:
-            self.radio_light.setChecked(True)
-
-        accent = self.view_model.get("Appearance", "accent_color", "Blue")
-        index = self.accent_combo.findText(accent)
-        if index != -1:
-            self.accent_combo.setCurrentIndex(index)
+        with QSignalBlocker(self.radio_light), QSignalBlocker(self.radio_dark), QSignalBlocker(self.accent_combo):
+            theme = self.view_model.get("Appearance", "theme", "Light")
+            if theme.lower() == "dark":
+                self.radio_dark.setChecked(True)
+            else:
+                self.radio_light.setChecked(True)
+
+            accent = self.view_model.get("Appearance", "accent_color", "Blue")
+            index = _ACCENT_INDEX.get(accent, -1)
+            if index != -1:
+                self.accent_combo.setCurrentIndex(index)
 
     def _update(self):
         theme = "Dark" if self.radio_dark.isChecked() else "Light"
         accent = self.accent_combo.currentText()
 
-        self.view_model.set("Appearance", "theme", theme)
-        self.view_model.set("Appearance", "accent_color", accent)
+        self.view_model.set_many({("Appearance", "theme"): theme, ("Appearance", "accent_color"): accent})
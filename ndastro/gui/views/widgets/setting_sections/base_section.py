@@ -0,0 +1,48 @@
+"""Base class shared by the settings dialog sections."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class BaseSection(QWidget):
+    """Base widget for settings sections laid out as a single top-aligned column."""
+
+    def _build_form(self, groups: Sequence[tuple[str | None, Sequence[QWidget]]]) -> QVBoxLayout:
+        """Lay out the section as groups of widgets, each optionally preceded by a label.
+
+        Args:
+            groups (Sequence[tuple[str | None, Sequence[QWidget]]]): The (label text, widgets) pairs, separated by a fixed spacing.
+
+        Returns:
+            QVBoxLayout: The layout installed on the section.
+
+        """
+        layout = QVBoxLayout(self)
+        layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+
+        for i, (label, widgets) in enumerate(groups):
+            if i:
+                layout.addSpacing(10)
+            if label is not None:
+                layout.addWidget(QLabel(label))
+            for widget in widgets:
+                layout.addWidget(widget)
+
+        return layout
+
+    def refresh(self) -> None:
+        """Reload the section's widgets from the view model."""
+        self._load()
+
+    def _load(self) -> None:
+        """Populate the section's widgets from the view model; a no-op for sections with nothing to load.
+
+        Sections backed by settings override this, and `refresh` calls it to pick up changes made elsewhere.
+        """
@@ -1,49 +1,59 @@
-import pytz
-from PySide6.QtCore import Qt
+from functools import lru_cache
+from zoneinfo import available_timezones
+
+from PySide6.QtCore import QSignalBlocker
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
-    QLabel,
-    QVBoxLayout,
-    QWidget,
 )
 
+from ndastro.gui.views.widgets.setting_sections.base_section import BaseSection
+
+_LOCALES = (
+    "en_US",
+    "fr_FR",
+    "de_DE",
+    "es_ES",
+    "hi_IN",
+    "ja_JP",
+    "zh_CN",
+)
+_LOCALE_INDEX = {locale: i for i, locale in enumerate(_LOCALES)}
+
+
+@lru_cache(maxsize=1)
+def _timezone_index() -> dict[str, int]:
+    timezones = sorted(available_timezones())
+    if not timezones:
+        # No system tz database (e.g. Windows without tzdata), fall back to the names bundled with pytz
+        from pytz import all_timezones  # noqa: PLC0415
+
+        timezones = all_timezones
+
+    return {tz: i for i, tz in enumerate(timezones)}
 
-class GeneralSection(QWidget):
+
+class GeneralSection(BaseSection):
     def __init__(self, view_model):
         super().__init__()
         self.view_model = view_model
 
         self.start_on_boot = QCheckBox("Start on system boot")
 
-        self.label_locale = QLabel("Language / Locale:")
         self.combo_locale = QComboBox()
-        self.combo_locale.addItems(
+        self.combo_locale.addItems(_LOCALES)
+
+        self.combo_timezone = QComboBox()
+        self.combo_timezone.addItems(list(_timezone_index()))
+
+        self._build_form(
             [
-                "en_US",
-                "fr_FR",
-                "de_DE",
-                "es_ES",
-                "hi_IN",
-                "ja_JP",
-                "zh_CN",
+                (None, (self.start_on_boot,)),
+                ("Language / Locale:", (self.combo_locale,)),
+                ("Time Zone:", (self.combo_timezone,)),
             ],
         )
 
-        self.label_timezone = QLabel("Time Zone:")
-        self.combo_timezone = QComboBox()
-        self.combo_timezone.addItems(pytz.all_timezones)
-
-        layout = QVBoxLayout(self)
-        layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        layout.addWidget(self.start_on_boot)
-        layout.addSpacing(10)
-        layout.addWidget(self.label_locale)
-        layout.addWidget(self.combo_locale)
-        layout.addSpacing(10)
-        layout.addWidget(self.label_timezone)
-        layout.addWidget(self.combo_timezone)
-
         self._load()
 
         self.start_on_boot.stateChanged.connect(self._update)
@@ -51,20 +61,25 @@ class GeneralSection(QWidget):
         self.combo_timezone.currentTextChanged.connect(self._update)
 
     def _load(self):
-        checked = self.view_model.get("General", "start_on_boot", "false") == "true"
-        self.start_on_boot.setChecked(checked)
+        with QSignalBlocker(self.start_on_boot), QSignalBlocker(self.combo_locale), QSignalBlocker(self.combo_timezone):
+            checked = self.view_model.get("General", "start_on_boot", "false") == "true"
+            self.start_on_boot.setChecked(checked)
 
-        saved_locale = self.view_model.get("General", "locale", "en_US")
-        index = self.combo_locale.findText(saved_locale)
-        if index != -1:
-            self.combo_locale.setCurrentIndex(index)
+            saved_locale = self.view_model.get("General", "locale", "en_US")
+            index = _LOCALE_INDEX.get(saved_locale, -1)
+            if index != -1:
+                self.combo_locale.setCurrentIndex(index)
 
-        saved_tz = self.view_model.get("General", "timezone", "UTC")
-        index = self.combo_timezone.findText(saved_tz)
-        if index != -1:
-            self.combo_timezone.setCurrentIndex(index)
+            saved_tz = self.view_model.get("General", "timezone", "UTC")
+            index = _timezone_index().get(saved_tz, -1)
+            if index != -1:
+                self.combo_timezone.setCurrentIndex(index)
 
     def _update(self):
-        self.view_model.set("General", "start_on_boot", "true" if self.start_on_boot.isChecked() else "false")
-        self.view_model.set("General", "locale", self.combo_locale.currentText())
-        self.view_model.set("General", "timezone", self.combo_timezone.currentText())
+        self.view_model.set_many(
+            {
+                ("General", "start_on_boot"): "true" if self.start_on_boot.isChecked() else "false",
+                ("General", "locale"): self.combo_locale.currentText(),
+                ("General", "timezone"): self.combo_timezone.currentText(),
+            },
+        )
@@ -6,7 +6,7 @@ application settings, including general and appearance settings.
 
 import asyncio
 
-from PySide6.QtCore import Signal, SignalInstance
+from PySide6.QtCore import Signal, SignalInstance, Slot
 from PySide6.QtGui import QShowEvent
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -64,6 +64,7 @@ class SettingsDialog(BaseDialogContent):
         self.save_button = QPushButton("Save")
         self.reset_button = QPushButton("Reset")
         self.close_button = QPushButton("Close")
+        self._background_tasks: set[asyncio.Task[None]] = set()
 
         self._setup_ui()
         self._connect_signals()
@@ -72,8 +73,9 @@ class SettingsDialog(BaseDialogContent):
         self.sidebar.addItem(QListWidgetItem("General"))
         self.sidebar.addItem(QListWidgetItem("Appearance"))
 
-        self.stack.addWidget(GeneralSection(self.view_model))
-        self.stack.addWidget(AppearanceSection(self.view_model))
+        self._sections = (GeneralSection(self.view_model), AppearanceSection(self.view_model))
+        for section in self._sections:
+            self.stack.addWidget(section)
 
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -91,18 +93,29 @@ class SettingsDialog(BaseDialogContent):
 
     def _connect_signals(self) -> None:
         self.sidebar.currentRowChanged.connect(self.stack.setCurrentIndex)
-        self.save_button.clicked.connect(lambda: asyncio.create_task(self._save_and_close()))
-        self.reset_button.clicked.connect(self.view_model.load_settings)
+        self.save_button.clicked.connect(self._on_save_clicked)
+        self.reset_button.clicked.connect(self._reload)
         self.close_button.clicked.connect(lambda: self._close_dialog.emit("close"))
 
+    @Slot()
+    def _on_save_clicked(self) -> None:
+        task = asyncio.create_task(self._save_and_close())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     async def _save_and_close(self) -> None:
         await self.view_model.save_settings()
         self._close_dialog.emit()
 
-    def show_event(self, arg__1: QShowEvent) -> None:
-        """Override show_event to load settings when the dialog is shown."""
+    def showEvent(self, event: QShowEvent) -> None:  # noqa: N802
+        """Load the saved settings into the sections when the dialog is shown."""
+        self._reload()
+        super().showEvent(event)
+
+    def _reload(self) -> None:
         self.view_model.load_settings()
-        super().showEvent(arg__1)
+        for section in self._sections:
+            section.refresh()
 
     @property
     def close_dialog(self) -> SignalInstance:
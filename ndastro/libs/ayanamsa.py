@@ -1,7 +1,10 @@
 """Module to define ayanamsa related definations."""
 
 import datetime
+from functools import lru_cache
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
 from skyfield.api import load
 
 from ndastro.libs.constants import AYANAMSA
@@ -9,48 +12,61 @@ from ndastro.libs.constants import AYANAMSA
 # Load Skyfield's timescale
 ts = load.timescale()
 
+# Julian Date of the 1900 epoch and the length of a Julian century, both constant for the formula
+_J1900_JD: float = ts.tt(AYANAMSA.CENTURY_19, 1, 1, 12).tt
+_JULIAN_CENTURY_DAYS: float = ts.tt(AYANAMSA.CENTURY_21, 1, 1, 12).tt - ts.tt(AYANAMSA.CENTURY_20, 1, 1, 12).tt
+
 
 def get_lahiri_ayanamsa(date: datetime.datetime) -> float:
     """Calculate the Lahiri Ayanamsa for a given date."""
+    return _get_lahiri_ayanamsa_for_day((date.year, date.month, date.day))
+
+
+@lru_cache(maxsize=4096)
+def _get_lahiri_ayanamsa_for_day(date: tuple[int, int, int]) -> float:
+    """Calculate the Lahiri Ayanamsa for a (year, month, day) tuple, memoized per day."""
     # Constants in the Lahiri Ayanamsa formula
     c0 = AYANAMSA.AYANAMSA_AT_J2000  # Constant term
     c1 = AYANAMSA.DEG_PER_JCENTURY  # Linear term (degrees per Julian century)
     c2 = AYANAMSA.DEG_PER_SQUARE_JCENTURY  # Quadratic term (degrees per square Julian century)
 
     # Calculate b6
-    b6 = calculate_b6((date.year, date.month, date.day))
+    b6 = calculate_b6(date)
 
     return c0 + c1 * b6 + c2 * (b6**2)
 
 
+def get_lahiri_ayanamsa_batch(years: ArrayLike, months: ArrayLike, days: ArrayLike) -> NDArray[np.float64]:
+    """Calculate the Lahiri Ayanamsa for arrays of years, months and days with a single vectorized Skyfield Time."""
+    t = ts.utc(np.asarray(years), np.asarray(months), np.asarray(days))
+    b6 = (t.tt - _J1900_JD) / _JULIAN_CENTURY_DAYS
+
+    return AYANAMSA.AYANAMSA_AT_J2000 + AYANAMSA.DEG_PER_JCENTURY * b6 + AYANAMSA.DEG_PER_SQUARE_JCENTURY * b6 * b6
+
+
 def calculate_b6(date: tuple[int, int, int]) -> float:
     """Calculate B6 parameter for Julian Date."""
-    # Calculate Julian Date using Skyfield
-    t = ts.utc(*date)
-    jd = t.tt  # Julian Date in Terrestrial Time
-    # Compute B6 parameter
-    return (jd - get_days_since_julian(AYANAMSA.CENTURY_19)) / get_days_in_julian_century(AYANAMSA.CENTURY_20, AYANAMSA.CENTURY_21)
+    # Julian Date in Terrestrial Time, measured in Julian centuries since 1900
+    return (ts.utc(*date).tt - _J1900_JD) / _JULIAN_CENTURY_DAYS
 
 
 def get_days_in_julian_century(start_year: int, end_year: int) -> float:
     """Calculate the number of days in a Julian century."""
-    # Define the start of a Julian century
-    start = ts.tt(start_year, 1, 1, 12)  # J2000.0 epoch (2451545.0 JD)
-
-    # Define the end of the Julian century (100 Julian years later)
-    end = ts.tt(end_year, 1, 1, 12)  # 2100 January 1, 12:00 TT
+    if (start_year, end_year) == (AYANAMSA.CENTURY_20, AYANAMSA.CENTURY_21):
+        return _JULIAN_CENTURY_DAYS
 
-    # Calculate the Julian Dates
-    jd_start = start.tt  # Julian Date at J2000.0
-    jd_end = end.tt  # Julian Date at 2100 January 1
+    # Define the start and end of the Julian century
+    start = ts.tt(start_year, 1, 1, 12)
+    end = ts.tt(end_year, 1, 1, 12)
 
     # Compute the number of days in the century
-    return jd_end - jd_start
+    return end.tt - start.tt
 
 
 def get_days_since_julian(century: int) -> float:
     """Calculate the number of days in a Julian century given."""
-    # Define the start of a Julian century
-    start = ts.tt(century, 1, 1, 12)  # J2000.0 epoch (2451545.0 JD)
+    if century == AYANAMSA.CENTURY_19:
+        return _J1900_JD
 
-    return start.tt
+    # Define the start of a Julian century
+    return ts.tt(century, 1, 1, 12).tt
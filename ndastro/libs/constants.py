@@ -1,7 +1,6 @@
 """Define all the constants needed for the ndastro libs."""
 
-from os import name
-from typing import Final
+from typing import ClassVar, Final
 
 
 class SYMBOLS:
@@ -27,6 +26,8 @@ class AYANAMSA:
 
     LAHIRI = 24.12
 
+    _VALUES: ClassVar[dict[str, float]] = {"lahiri": LAHIRI}
+
     def __init__(self, name: str) -> None:
         """Set current active ayanamsa.
 
@@ -35,6 +36,7 @@ class AYANAMSA:
 
         """
         self._name = name
+        self._values = dict(self._VALUES)
 
     @property
     def name(self) -> str:
@@ -49,19 +51,11 @@ class AYANAMSA:
             value (float): Ayanamsa value
 
         """
-        match name:
-            case "lahiri":
-                return self.LAHIRI
-            case _:
-                return self.LAHIRI
+        return self._values.get(self._name, self.LAHIRI)
 
     @value.setter
     def value(self, val: float) -> None:
-        match name:
-            case "lahiri":
-                self.LAHIRI = val
-            case _:
-                self.LAHIRI = 24
+        self._values[self._name] = val
 
 
 DEGREE_MAX = 360
@@ -72,4 +66,4 @@ TOTAL_PADAM = 4
 DEGREES_PER_NAKSHATRA = 13.333333333333334
 DEGREES_PER_PADAM = 3.3333333333333335
 
-KATTAM_RASI_MAP = [12, 1, 2, 3, 11, 4, 10, 5, 9, 8, 7, 6]
+KATTAM_RASI_MAP: Final[tuple[int, ...]] = (12, 1, 2, 3, 11, 4, 10, 5, 9, 8, 7, 6)
@@ -39,18 +39,27 @@ class CustomPopup(QWidget):
         self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)  # Set minimum size
 
         # Add elements to the popup
-        label = QLabel(f"Details for: {text}")
-        label.setStyleSheet("font-weight: bold;")
+        self._label = QLabel(f"Details for: {text}")
+        self._label.setStyleSheet("font-weight: bold;")
         button = QPushButton("Click Me")
 
         layout = QVBoxLayout()
-        layout.addWidget(label)
+        layout.addWidget(self._label)
         layout.addWidget(button)
 
         self.setLayout(layout)
 
         self.mouse_inside = False  # Track mouse presence
 
+    def set_text(self, text: str) -> None:
+        """Update the text shown in the popup.
+
+        Args:
+            text (str): text of the hovered element
+
+        """
+        self._label.setText(f"Details for: {text}")
+
     def enterEvent(self, event: QEnterEvent) -> None:
         """Fire when the mouse enters the popup."""
         self.mouse_inside = True
@@ -7,6 +7,8 @@ Includes:
 
 from datetime import datetime
 
+import numpy as np
+
 from ndastro.gui.models.dasha_detail import DashaDetail, Dashas
 from ndastro.libs.custom_errors import (
     MissingPlanetsPeriodError,
@@ -22,6 +24,11 @@ class DashaSystem:
     def __init__(self) -> None:
         """Initialize the DashaSystem class with a list of available dasha systems."""
         self.available_systems = [Dashas.VIMSHOTTARI, Dashas.ASHTOTTARI, Dashas.KALACHAKRA]
+        self._details = {
+            Dashas.VIMSHOTTARI: self.get_vimshottari_details(),
+            Dashas.ASHTOTTARI: self.get_ashtottari_details(),
+            Dashas.KALACHAKRA: self.get_kalachakra_details(),
+        }
 
     def get_all_dasha_systems(self) -> list[Dashas]:
         """Return list of all available dasha systems."""
@@ -102,33 +109,27 @@ class DashaSystem:
 
         """
         # Get the dasha details based on the selected system
-        if dasha_system == Dashas.VIMSHOTTARI:
-            dasha_details = self.get_vimshottari_details()
-        elif dasha_system == Dashas.ASHTOTTARI:
-            dasha_details = self.get_ashtottari_details()
-        elif dasha_system == Dashas.KALACHAKRA:
-            dasha_details = self.get_kalachakra_details()
-        else:
-            raise UnsupportedDashaSystemError(dasha_system)
+        try:
+            dasha_details = self._details[dasha_system]
+        except KeyError:
+            raise UnsupportedDashaSystemError(dasha_system) from None
 
         # Calculate the total elapsed time in days
         total_days = (current_datetime - birth_datetime).days
 
-        # Convert the cycle years to days
-        cycle_days = dasha_details.cycle_years * 365
-
         # Find the position within the cycle
-        position_in_cycle = total_days % cycle_days
+        position_in_cycle = total_days % dasha_details.cycle_days
 
-        # Iterate through the planets and their periods to find the running dasha
+        # The planets and their periods are needed to find the running dasha
         if not dasha_details.planets_period:
             raise MissingPlanetsPeriodError
 
-        elapsed_days = 0
-        for planet, period_years in dasha_details.planets_period.items():
-            period_days = period_years * 365
-            if elapsed_days + period_days > position_in_cycle:
-                return planet
-            elapsed_days += period_days
+        planets = dasha_details.planets_order
+
+        # The running dasha is the first period ending after the position in the cycle
+        index = int(np.searchsorted(dasha_details.period_ends, position_in_cycle, side="right"))
+        if index == len(planets):
+            raise UnableToDetermineDashaError
+
+        return planets[index]
 
-        raise UnableToDetermineDashaError
@@ -0,0 +1,66 @@
+"""Module to hold the shared skyfield timescale and the lazily loaded JPL ephemeris."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from threading import Lock, Thread
+from typing import TYPE_CHECKING
+
+from skyfield.api import Loader
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from skyfield.jpllib import SpiceKernel
+
+load = Loader("ndastro/resources/data")
+ts = load.timescale()
+
+_EPH_LOCK = Lock()
+
+
+def get_eph() -> SpiceKernel:
+    """Return the JPL ephemeris, loading it on first use rather than when the module is imported.
+
+    Callers arriving while the ephemeris is being loaded, e.g. by `preload_eph`, wait for that load instead of starting another.
+
+    Returns:
+        SpiceKernel: The loaded de440s ephemeris.
+
+    """
+    with _EPH_LOCK:
+        return _load_eph()
+
+
+def preload_eph() -> Thread:
+    """Start loading the JPL ephemeris on a background thread so it is ready by the first chart.
+
+    Returns:
+        Thread: The daemon thread doing the load.
+
+    """
+    thread = Thread(target=get_eph, name="ephemeris-preload", daemon=True)
+    thread.start()
+
+    return thread
+
+
+@lru_cache(maxsize=1)
+def eph_coverage() -> tuple[datetime, datetime]:
+    """Return the span of dates every body in the JPL ephemeris covers.
+
+    Returns:
+        tuple[datetime, datetime]: The first and last UTC instants positions can be computed for.
+
+    """
+    segments = [segment.spk_segment for segment in get_eph().segments]
+    start = max(segment.start_jd for segment in segments)
+    end = min(segment.end_jd for segment in segments)
+
+    return ts.tdb_jd(start).utc_datetime(), ts.tdb_jd(end).utc_datetime()
+
+
+@lru_cache(maxsize=1)
+def _load_eph() -> SpiceKernel:
+    """Read de440s.bsp, once."""
+    return load("de440s.bsp")
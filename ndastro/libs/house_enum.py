@@ -2,8 +2,7 @@
 
 from enum import IntEnum
 
-from i18n import t
-
+from ndastro.libs.i18n_cache import t
 from ndastro.libs.planet_enum import Planets
 
 
@@ -0,0 +1,52 @@
+"""Module to hold the i18n configuration and the memoized translation lookup."""
+
+from functools import lru_cache
+from pathlib import Path
+
+from i18n import get
+from i18n import set as set_i18n_config
+from i18n import t as translate
+
+
+def configure_i18n(load_path: Path, locale: str | None = None) -> None:
+    """Configure python-i18n to read the app's JSON locale files, shared by the app and the tests.
+
+    Args:
+        load_path (Path): the directory holding the `{namespace}.{locale}.json` files
+        locale (str | None): the locale to activate, or None to keep the current one
+
+    """
+    set_i18n_config("file_format", "json")
+    set_i18n_config("filename_format", "{namespace}.{locale}.{format}")
+    set_i18n_config("load_path", [load_path])
+    set_i18n_config("skip_locale_root_data", value=True)
+    if locale is not None:
+        set_i18n_config("locale", locale)
+
+    # Lookups made under the previous configuration may have cached the raw key as a fallback
+    _translate_cached.cache_clear()
+
+
+def t(key: str, **kwargs: object) -> str:
+    """Translate the key for the active locale, memoizing the result.
+
+    Args:
+        key (str): the translation key
+        **kwargs (object): the interpolation values for the translation
+
+    Returns:
+        str: the translated text
+
+    """
+    locale = get("locale")
+    try:
+        return _translate_cached(locale, key, tuple(sorted(kwargs.items())))
+    except TypeError:
+        # Unhashable interpolation values can't be part of the cache key, so translate them uncached
+        return translate(key, locale=locale, **kwargs)
+
+
+@lru_cache(maxsize=512)
+def _translate_cached(locale: str, key: str, kwargs: tuple[tuple[str, object], ...]) -> str:
+    """Translate the key for the locale, memoized per locale, key and interpolation values."""
+    return translate(key, locale=locale, **dict(kwargs))
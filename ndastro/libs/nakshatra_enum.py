@@ -2,8 +2,7 @@
 
 from enum import Enum
 
-from i18n import t
-
+from ndastro.libs.i18n_cache import t
 from ndastro.libs.planet_enum import Planets
 
 
@@ -45,7 +44,7 @@ class Natchaththirams(Enum):
             str: The display name of the star.
 
         """
-        return t(f"core.stars.star{self.value}")
+        return t(_STAR_KEYS[self.value])
 
     @property
     def owner(self) -> Planets:
@@ -55,37 +54,7 @@ class Natchaththirams(Enum):
             str: The name of the planet that owns the star.
 
         """
-        owners = {
-            1: "kethu",
-            2: "venus",
-            3: "sun",
-            4: "moon",
-            5: "mars barycenter",
-            6: "rahu",
-            7: "jupiter barycenter",
-            8: "saturn barycenter",
-            9: "mercury",
-            10: "kethu",
-            11: "venus",
-            12: "sun",
-            13: "moon",
-            14: "mars barycenter",
-            15: "rahu",
-            16: "jupiter barycenter",
-            17: "saturn barycenter",
-            18: "mercury",
-            19: "kethu",
-            20: "venus",
-            21: "sun",
-            22: "moon",
-            23: "mars barycenter",
-            24: "rahu",
-            25: "jupiter barycenter",
-            26: "saturn barycenter",
-            27: "mercury",
-        }
-
-        return Planets.from_code(owners[self.value])
+        return _STAR_OWNERS[self.value]
 
     @staticmethod
     def to_string(num: int) -> str:
@@ -98,14 +67,50 @@ class Natchaththirams(Enum):
             str: return the star name
 
         """
-        return t(f"core.stars.star{num}")
+        return t(_STAR_KEYS[num])
 
-    @staticmethod
-    def to_list() -> list[str]:
+    @classmethod
+    def to_list(cls) -> list[str]:
         """Convert enum to list of enum item name.
 
         Returns:
             list[str]: list of enum item name
 
         """
-        return [el.name for el in Natchaththirams]
+        return list(cls.__members__)
+
+
+_STAR_KEYS = {star.value: f"core.stars.star{star.value}" for star in Natchaththirams}
+
+_STAR_OWNERS = {
+    value: Planets.from_code(code)
+    for value, code in {
+        1: "kethu",
+        2: "venus",
+        3: "sun",
+        4: "moon",
+        5: "mars barycenter",
+        6: "rahu",
+        7: "jupiter barycenter",
+        8: "saturn barycenter",
+        9: "mercury",
+        10: "kethu",
+        11: "venus",
+        12: "sun",
+        13: "moon",
+        14: "mars barycenter",
+        15: "rahu",
+        16: "jupiter barycenter",
+        17: "saturn barycenter",
+        18: "mercury",
+        19: "kethu",
+        20: "venus",
+        21: "sun",
+        22: "moon",
+        23: "mars barycenter",
+        24: "rahu",
+        25: "jupiter barycenter",
+        26: "saturn barycenter",
+        27: "mercury",
+    }.items()
+}
@@ -2,7 +2,7 @@
 
 from enum import IntEnum
 
-from i18n import t
+from ndastro.libs.i18n_cache import t
 
 
 class Planets(IntEnum):
@@ -31,7 +31,7 @@ class Planets(IntEnum):
             str: return the planet name
 
         """
-        return t(f"core.planets.planet{num}")
+        return t(_PLANET_KEYS[num])
 
     @staticmethod
     def from_code(code: str) -> "Planets":
@@ -44,31 +44,17 @@ class Planets(IntEnum):
             Planets: the corresponding planet enum
 
         """
-        planet_codes = {
-            "empty": Planets.EMPTY,
-            "ascendant": Planets.ASCENDANT,
-            "sun": Planets.SUN,
-            "moon": Planets.MOON,
-            "mars barycenter": Planets.MARS,
-            "mercury": Planets.MERCURY,
-            "jupiter barycenter": Planets.JUPITER,
-            "venus": Planets.VENUS,
-            "saturn barycenter": Planets.SATURN,
-            "rahu": Planets.RAHU,
-            "kethu": Planets.KETHU,
-        }
-
-        return planet_codes.get(code, Planets.EMPTY)
+        return _CODE_PLANETS.get(code, Planets.EMPTY)
 
-    @staticmethod
-    def to_list() -> list[str]:
+    @classmethod
+    def to_list(cls) -> list[str]:
         """Convert planet enum to list of planet name.
 
         Returns:
             list[str]: list of planet names
 
         """
-        return [el.name for el in Planets]
+        return list(cls.__members__)
 
     @property
     def code(self) -> str:
@@ -78,21 +64,7 @@ class Planets(IntEnum):
             str: the planet code
 
         """
-        planet_codes = {
-            Planets.EMPTY: "empty",
-            Planets.ASCENDANT: "ascendant",
-            Planets.SUN: "sun",
-            Planets.MOON: "moon",
-            Planets.MARS: "mars barycenter",
-            Planets.MERCURY: "mercury",
-            Planets.JUPITER: "jupiter barycenter",
-            Planets.VENUS: "venus",
-            Planets.SATURN: "saturn barycenter",
-            Planets.RAHU: "rahu",
-            Planets.KETHU: "kethu",
-        }
-
-        return planet_codes.get(self, "empty")
+        return _PLANET_CODES.get(self, "empty")
 
     @property
     def color(self) -> str:
@@ -102,18 +74,37 @@ class Planets(IntEnum):
             str: the planet color code
 
         """
-        planet_colors = {
-            Planets.EMPTY: "#000000",  # Black
-            Planets.ASCENDANT: "#FFFFFF",  # White
-            Planets.SUN: "#FFD700",  # Gold
-            Planets.MOON: "#C0C0C0",  # Silver
-            Planets.MARS: "#FF0000",  # Red
-            Planets.MERCURY: "#008000",  # Green
-            Planets.JUPITER: "#FFFF00",  # Yellow
-            Planets.VENUS: "#FF69B4",  # Pink
-            Planets.SATURN: "#00008B",  # DarkBlue
-            Planets.RAHU: "#8A2BE2",  # BlueViolet
-            Planets.KETHU: "#8B0000",  # DarkRed
-        }
-
-        return planet_colors.get(self, "#000000")  # Default to Black
+        return _PLANET_COLORS.get(self, "#000000")  # Default to Black
+
+
+_PLANET_KEYS = {planet.value: f"core.planets.planet{planet.value}" for planet in Planets}
+
+_PLANET_CODES = {
+    Planets.EMPTY: "empty",
+    Planets.ASCENDANT: "ascendant",
+    Planets.SUN: "sun",
+    Planets.MOON: "moon",
+    Planets.MARS: "mars barycenter",
+    Planets.MERCURY: "mercury",
+    Planets.JUPITER: "jupiter barycenter",
+    Planets.VENUS: "venus",
+    Planets.SATURN: "saturn barycenter",
+    Planets.RAHU: "rahu",
+    Planets.KETHU: "kethu",
+}
+
+_CODE_PLANETS = {code: planet for planet, code in _PLANET_CODES.items()}
+
+_PLANET_COLORS = {
+    Planets.EMPTY: "#000000",  # Black
+    Planets.ASCENDANT: "#FFFFFF",  # White
+    Planets.SUN: "#FFD700",  # Gold
+    Planets.MOON: "#C0C0C0",  # Silver
+    Planets.MARS: "#FF0000",  # Red
+    Planets.MERCURY: "#008000",  # Green
+    Planets.JUPITER: "#FFFF00",  # Yellow
+    Planets.VENUS: "#FF69B4",  # Pink
+    Planets.SATURN: "#00008B",  # DarkBlue
+    Planets.RAHU: "#8A2BE2",  # BlueViolet
+    Planets.KETHU: "#8B0000",  # DarkRed
+}
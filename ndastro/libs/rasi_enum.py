@@ -4,8 +4,7 @@ from __future__ import annotations
 
 from enum import IntEnum
 
-from i18n import t
-
+from ndastro.libs.i18n_cache import t
 from ndastro.libs.planet_enum import Planets
 
 
@@ -32,7 +31,7 @@ class Rasis(IntEnum):
             str: Localized name of the Rasi.
 
         """
-        return t(f"core.rasis.rasi{self.value}")
+        return t(_RASI_KEYS[self.value])
 
     @property
     def owner(self) -> Planets | None:
@@ -84,15 +83,15 @@ class Rasis(IntEnum):
         """
         return t(f"core.rasis.rasi{cls.value}")
 
-    @staticmethod
-    def to_list() -> list[str]:
+    @classmethod
+    def to_list(cls) -> list[str]:
         """Get a list of all Rasi names.
 
         Returns:
             list[str]: List of all Rasi names.
 
         """
-        return [el.name for el in Rasis]
+        return list(cls.__members__)
 
     @staticmethod
     def to_4x4list() -> list[list[str]]:
@@ -102,11 +101,21 @@ class Rasis(IntEnum):
             list[list[str]]: 4x4 grid of Rasi names.
 
         """
-        rasis = Rasis.to_list()
-
-        return [
-            [rasis[11], rasis[0], rasis[1], rasis[2]],
-            [rasis[10], "", "", rasis[3]],
-            [rasis[9], "", "", rasis[4]],
-            [rasis[8], rasis[7], rasis[6], rasis[5]],
-        ]
+        return [list(row) for row in _RASI_4X4]
+
+
+_RASI_KEYS = {rasi.value: f"core.rasis.rasi{rasi.value}" for rasi in Rasis}
+
+
+def _build_rasi_4x4() -> tuple[tuple[str, ...], ...]:
+    rasis = Rasis.to_list()
+
+    return (
+        (rasis[11], rasis[0], rasis[1], rasis[2]),
+        (rasis[10], "", "", rasis[3]),
+        (rasis[9], "", "", rasis[4]),
+        (rasis[8], rasis[7], rasis[6], rasis[5]),
+    )
+
+
+_RASI_4X4 = _build_rasi_4x4()
@@ -1,26 +1,29 @@
 """Provides functions to determine if a planet is in retrograde motion."""
 
-from datetime import datetime, timedelta
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import TYPE_CHECKING, cast
 
-from skyfield.api import Loader
+import numpy as np
+from numpy.typing import NDArray
 from skyfield.searchlib import find_discrete
 from skyfield.timelib import Time
 from skyfield.toposlib import Topos
 from skyfield.units import Angle
 
+from ndastro.libs.ephemeris import eph_coverage, get_eph, ts
 from ndastro.libs.planet_enum import Planets
 
 if TYPE_CHECKING:
     from skyfield.positionlib import Barycentric
 
-# Load ephemeris
-load = Loader("ndastro/resources/data")
-eph = load("de440s.bsp")
-ts = load.timescale()
+# Planets that can appear retrograde, and how finely find_all_retrograde_periods samples their motion
+_RETROGRADE_PLANETS = (Planets.MARS.code, Planets.MERCURY.code, Planets.JUPITER.code, Planets.VENUS.code, Planets.SATURN.code)
+_SAMPLES_PER_DAY = 2
 
-# Define Earth
-earth = eph["earth"]
+# Room kept inside the ephemeris coverage for the day-earlier comparison sample and the light-time correction
+_COVERAGE_MARGIN = timedelta(days=2)
 
 
 class RetrogradeFunction:
@@ -52,35 +55,35 @@ class RetrogradeFunction:
         self.latitude = latitude
         self.longitude = longitude
         self.step_days = 7
+        self._observer = get_eph()["earth"] + Topos(latitude=latitude, longitude=longitude)
+        self._planet = get_eph()[planet_name]
 
-    def __call__(self, t: Time) -> bool:
+    def __call__(self, t: Time) -> bool | NDArray[np.bool_]:
         """Determine if the planet is in retrograde motion at a given time.
 
         This method calculates the ecliptic longitude of the planet at the given time `t`
         and compares it with the ecliptic longitude of the planet at the previous time `t-1`.
-        If the longitude decreases, the planet is in retrograde motion.
+        If the longitude decreases, the planet is in retrograde motion. Both instants are
+        evaluated in a single vectorized Skyfield call, so `t` may be an array of times.
 
         Args:
             t (Time): The time at which to check for retrograde motion.
 
         Returns:
-            bool: True if the planet is in retrograde motion, False otherwise.
+            bool | NDArray[np.bool_]: True if the planet is in retrograde motion, False otherwise, per time in `t`.
 
         """
-        observer = (earth + Topos(latitude=self.latitude, longitude=self.longitude)).at(
-            t,
-        )
-        astrometric = cast("Barycentric", observer).observe(eph[self.planet_name]).apparent()
-        _, lon_now, _ = astrometric.ecliptic_latlon()  # Get ecliptic coordinates
+        tt = np.atleast_1d(t.tt)
+        both = t.ts.tt_jd(np.concatenate((tt, tt - 1)))
 
-        observer2 = (earth + Topos(latitude=self.latitude, longitude=self.longitude)).at(t - 1)
-        astrometric2 = cast("Barycentric", observer2).observe(eph[self.planet_name]).apparent()
-        _, lon_prev, _ = astrometric2.ecliptic_latlon()  # Get ecliptic coordinates
+        observer = self._observer.at(both)
+        astrometric = cast("Barycentric", observer).observe(self._planet).apparent()
+        _, lon, _ = astrometric.ecliptic_latlon()  # Get ecliptic coordinates
 
-        return cast("float", lon_now.degrees) < cast(
-            "float",
-            lon_prev.degrees,
-        )  # Retrograde if longitude decreases
+        lon_now, lon_prev = np.split(cast("NDArray[np.float64]", lon.degrees), 2)
+        retrograde = lon_now < lon_prev  # Retrograde if longitude decreases
+
+        return retrograde.reshape(np.shape(t.tt))
 
 
 def __get_retrograde_function(
@@ -151,6 +154,65 @@ def find_retrograde_periods(
     return retrograde_periods
 
 
+def find_all_retrograde_periods(
+    start_date: datetime,
+    end_date: datetime,
+    planet_names: tuple[str, ...],
+    latitude: float,
+    longitude: float,
+) -> dict[str, list[tuple[datetime, datetime]]]:
+    """Calculate the retrograde periods of several planets over one shared time grid.
+
+    The observer's position is computed once for the grid and each planet is observed over it in a single
+    vectorized call. A planet is retrograde at a sample when its longitude is lower than a day earlier, and the
+    start and end of each period are interpolated from where that daily motion crosses zero.
+
+    Args:
+        start_date (datetime): The start date of the period to check for retrograde motion.
+        end_date (datetime): The end date of the period to check for retrograde motion.
+        planet_names (tuple[str, ...]): The names of the planets to check for retrograde motion.
+        latitude (float): The latitude of the observation location.
+        longitude (float): The longitude of the observation location.
+
+    Returns:
+        dict[str, list[tuple[datetime, datetime]]]: The start and end datetime of each retrograde period, per planet name.
+
+    """
+    t0 = ts.utc(start_date)
+    t1 = ts.utc(end_date)
+
+    # Start the grid a day early so every sample in the range has a sample a day before it
+    lag = _SAMPLES_PER_DAY
+    count = int(np.ceil((t1.tt - t0.tt) * _SAMPLES_PER_DAY)) + 1
+    tt = t0.tt + np.arange(-lag, count) / _SAMPLES_PER_DAY
+    eph = get_eph()
+    observer = cast("Barycentric", (eph["earth"] + Topos(latitude=latitude, longitude=longitude)).at(ts.tt_jd(tt)))
+    sample_tt = tt[lag:]
+
+    periods: dict[str, list[tuple[datetime, datetime]]] = {}
+    for planet_name in planet_names:
+        _, lon, _ = observer.observe(eph[planet_name]).apparent().ecliptic_latlon()
+        degrees = cast("NDArray[np.float64]", lon.degrees)
+        motion = (degrees[lag:] - degrees[:-lag] + 180) % 360 - 180  # daily motion, unaffected by the wrap at 360
+        retrograde = motion < 0
+
+        changes = np.flatnonzero(retrograde[1:] != retrograde[:-1]) + 1
+        before, after = motion[changes - 1], motion[changes]
+        crossings = sample_tt[changes - 1] + (sample_tt[changes] - sample_tt[changes - 1]) * before / (before - after)
+        crossings = crossings[crossings <= t1.tt]
+
+        # Each crossing toggles the state, so boundaries alternate start/end once the initial state is accounted for
+        boundaries = [t0.tt] if retrograde[0] else []
+        boundaries.extend(crossings.tolist())
+        if len(boundaries) % 2:
+            boundaries.append(t1.tt)
+
+        dates = ts.tt_jd(np.array(boundaries)).utc_datetime() if boundaries else []
+        periods[planet_name] = [(dates[i], dates[i + 1]) for i in range(0, len(dates), 2)]
+
+    return periods
+
+
 def is_planet_in_retrograde(
     check_date: datetime,
     planet_name: str,
@@ -169,16 +231,80 @@ def is_planet_in_retrograde(
         bool: True if the planet is in retrograde motion on the given date, otherwise False.
 
     """
-    if planet_name not in [Planets.SUN.code, Planets.MOON.code, Planets.ASCENDANT.code, Planets.EMPTY.code]:
-        start_date = check_date - timedelta(days=365)
-        end_date = check_date + timedelta(days=365)
-        retrograde_periods = find_retrograde_periods(
-            start_date,
-            end_date,
+    return batch_retrograde(check_date, latitude, longitude, (planet_name,))[planet_name]
+
+
+def batch_retrograde(
+    check_date: datetime,
+    latitude: Angle,
+    longitude: Angle,
+    planet_names: Iterable[str],
+) -> dict[str, bool]:
+    """Check which of the given planets are in retrograde motion on a specific date.
+
+    All planets are looked up in one set of retrograde periods for the date's year and location.
+
+    Args:
+        check_date (datetime): The date to check for retrograde motion.
+        latitude (Angle): The latitude of the observation location.
+        longitude (Angle): The longitude of the observation location.
+        planet_names (Iterable[str]): The names of the planets to check.
+
+    Returns:
+        dict[str, bool]: Whether each planet is in retrograde motion on the given date, keyed by planet name.
+
+    """
+    lat = round(cast("float", latitude.degrees), 4)
+    lon = round(cast("float", longitude.degrees), 4)
+
+    flags: dict[str, bool] = {}
+    for planet_name in planet_names:
+        if planet_name in [Planets.SUN.code, Planets.MOON.code, Planets.ASCENDANT.code, Planets.EMPTY.code]:
+            flags[planet_name] = False
+            continue
+
+        retrograde_periods = _find_all_retrograde_periods_around(check_date.year, lat, lon).get(planet_name)
+        if retrograde_periods is None:
+            retrograde_periods = _find_retrograde_periods_around(check_date.year, planet_name, lat, lon)
+
+        flags[planet_name] = any(period_start <= check_date <= period_end for period_start, period_end in retrograde_periods)
+
+    return flags
+
+
+@lru_cache(maxsize=64)
+def _find_all_retrograde_periods_around(year: int, latitude: float, longitude: float) -> dict[str, tuple[tuple[datetime, datetime], ...]]:
+    """Return the retrograde periods of every planet that can be retrograde around the given year, memoized per year.
+
+    The window spans from the start of the previous year to the end of the next year, clamped to the ephemeris coverage.
+    """
+    periods = find_all_retrograde_periods(
+        *_search_window(year),
+        _RETROGRADE_PLANETS,
+        latitude,
+        longitude,
+    )
+    return {planet_name: tuple(planet_periods) for planet_name, planet_periods in periods.items()}
+
+
+@lru_cache(maxsize=256)
+def _find_retrograde_periods_around(year: int, planet_name: str, latitude: float, longitude: float) -> tuple[tuple[datetime, datetime], ...]:
+    """Return the retrograde periods from the start of the previous year to the end of the next year, memoized per year.
+
+    The window always spans at least a year either side of any date within the given year, clamped to the ephemeris coverage.
+    """
+    return tuple(
+        find_retrograde_periods(
+            *_search_window(year),
             planet_name,
-            cast("float", latitude.degrees),
-            cast("float", longitude.degrees),
-        )
+            latitude,
+            longitude,
+        ),
+    )
+
+
+def _search_window(year: int) -> tuple[datetime, datetime]:
+    """Return the start of the previous year to the end of the next year, kept within the ephemeris coverage."""
+    first, last = eph_coverage()
 
-        return any(period_start <= check_date <= period_end for period_start, period_end in retrograde_periods)
-    return False
+    return max(datetime(year - 1, 1, 1, tzinfo=UTC), first + _COVERAGE_MARGIN), min(datetime(year + 2, 1, 1, tzinfo=UTC), last - _COVERAGE_MARGIN)
@@ -3,22 +3,26 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timedelta
-from itertools import groupby
-from math import atan2, ceil, cos, degrees, floor, radians, sin, tan
+from datetime import date, datetime, timedelta
+from functools import cache, lru_cache
+from math import atan2, cos, degrees, modf, radians, sin, tan
 from typing import TYPE_CHECKING, cast
 
-from i18n import t
+import numpy as np
 from skyfield.almanac import sunrise_sunset
-from skyfield.api import Loader
 from skyfield.searchlib import find_discrete
 
 from ndastro.gui.models.planet_position import PlanetDetail
+from ndastro.libs.ephemeris import get_eph, ts
+from ndastro.libs.i18n_cache import t
 from ndastro.libs.nakshatra_enum import Natchaththirams
 from ndastro.libs.planet_enum import Planets
-from ndastro.libs.retrograde import is_planet_in_retrograde
+from ndastro.libs.retrograde import batch_retrograde, is_planet_in_retrograde  # noqa: F401 - is_planet_in_retrograde is re-exported
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
     from skyfield.positionlib import Barycentric
     from skyfield.timelib import Time
     from skyfield.vectorlib import VectorSum
@@ -43,9 +47,27 @@ from ndastro.libs.constants import (
 from ndastro.libs.house_enum import Houses
 from ndastro.libs.rasi_enum import Rasis
 
-load = Loader("ndastro/resources/data")
-eph = load("de440s.bsp")
-ts = load.timescale()
+_PLANETS = {
+    "Sun": "sun",
+    "Moon": "moon",
+    "Mercury": "mercury",
+    "Venus": "venus",
+    "Mars": "mars barycenter",
+    "Jupiter": "jupiter barycenter",
+    "Saturn": "saturn barycenter",
+    "Rahu": "rahu",
+}
+
+# Enum per ephemeris code, resolved once; short names go through the locale-keyed translation cache
+_PLANET_ENUMS = {code: Planets.from_code(code) for code in _PLANETS.values()}
+
+_ARCMINUTES_PER_NAKSHATRA = DEGREE_MAX / TOTAL_NAKSHATRAS * 60.0
+
+
+@cache
+def _get_body(code: str) -> VectorSum:
+    """Return the ephemeris body for the code, resolved once per code."""
+    return get_eph()[code]
 
 
 def sign(num: int) -> int:
@@ -89,9 +111,26 @@ def get_tropical_position_of(planet_code: str, lat: Angle, lon: Angle, given_tim
         tuple[Angle, Angle, Distance]: The tropical latitude, longitude, and distance of the planet.
 
     """
-    t = ts.utc(given_time)
-    observer: VectorSum = eph["earth"] + Topos(lat, lon)
-    astrometric = cast("Barycentric", observer.at(t)).observe(eph[planet_code]).apparent()
+    observer = _make_observer(cast("float", lat.degrees), cast("float", lon.degrees))
+
+    return _observe(planet_code, cast("Barycentric", observer.at(_make_time(given_time))))
+
+
+@lru_cache(maxsize=256)
+def _make_time(given_time: datetime) -> Time:
+    """Return the skyfield time for the datetime, memoized as charts for the same moment are built repeatedly."""
+    return ts.utc(given_time)
+
+
+@lru_cache(maxsize=256)
+def _make_observer(lat_degrees: float, lon_degrees: float) -> VectorSum:
+    """Return the earth + Topos observer for the location, memoized per latitude and longitude."""
+    return _get_body("earth") + Topos(latitude_degrees=lat_degrees, longitude_degrees=lon_degrees)
+
+
+def _observe(planet_code: str, observer_at: Barycentric) -> tuple[Angle, Angle, Distance]:
+    """Return the apparent ecliptic latitude, longitude, and distance of the planet from the observer's position at a time."""
+    astrometric = observer_at.observe(_get_body(planet_code)).apparent()
 
     return astrometric.ecliptic_latlon()
 
@@ -108,42 +147,49 @@ def get_tropical_planetary_positions(lat: Angle, lon: Angle, given_time: datetim
         list[PlanetDetail]: A list of tropical positions of the planets.
 
     """
-    planets = {
-        "Sun": "sun",
-        "Moon": "moon",
-        "Mercury": "mercury",
-        "Venus": "venus",
-        "Mars": "mars barycenter",
-        "Jupiter": "jupiter barycenter",
-        "Saturn": "saturn barycenter",
-        "Rahu": "rahu",
-    }
     positions: list[PlanetDetail] = []
 
-    for planet_name, planet_code in planets.items():
+    # The observer's position at the observation time is the same for every planet, so compute it once
+    observer = _make_observer(cast("float", lat.degrees), cast("float", lon.degrees))
+    observer_at = cast("Barycentric", observer.at(_make_time(given_time)))
+
+    for planet_name, planet_code in _PLANETS.items():
         if planet_code == "rahu":
             nodes = calculate_lunar_nodes(given_time)
             positions.extend(nodes)
             continue
 
-        lat, lon, distance = get_tropical_position_of(planet_code, lat, lon, given_time)
+        plat, plon, distance = _observe(planet_code, observer_at)
 
         positions.append(
             PlanetDetail(
                 planet_name,
-                t(f"core.planets.planet{Planets.from_code(planet_code)}")[:2],
-                lat,
-                lon,
+                Planets.to_string(_PLANET_ENUMS[planet_code])[:2],
+                plat,
+                plon,
                 distance=distance,
                 rasi_occupied=Rasis.ARIES,
                 house_posited_at=Houses.HOUSE1,
-                planet=Planets.from_code(planet_code),
+                planet=_PLANET_ENUMS[planet_code],
             ),
         )
 
     return positions
 
 
+@lru_cache(maxsize=128)
+def _lunar_nodes_raw(given_time: datetime) -> tuple[float, float]:
+    """Return the longitudes of Rahu and Kethu in degrees, memoized as they depend only on the time and not the location."""
+    ecliptic = inertial_frames["ECLIPJ2000"]
+
+    position = cast("VectorSum", (_get_body("moon") - _get_body("earth"))).at(_make_time(given_time))
+    elements = osculating_elements_of(position, ecliptic)
+
+    rahu_position = cast("float", cast("Angle", elements.longitude_of_ascending_node).degrees)
+
+    return rahu_position, normalize_degree(rahu_position + 180)
+
+
 def calculate_lunar_nodes(given_time: datetime) -> list[PlanetDetail]:
     """Calculate the positions of the lunar nodes.
 
@@ -154,42 +200,39 @@ def calculate_lunar_nodes(given_time: datetime) -> list[PlanetDetail]:
         list[PlanetDetail]: A list containing the positions of Rahu and Kethu.
 
     """
-    tm = ts.utc(given_time)
-    ecliptic = inertial_frames["ECLIPJ2000"]
-
-    earth = eph["earth"]
-    moon = eph["moon"]
-    position = cast("VectorSum", (moon - earth)).at(tm)
-    elements = osculating_elements_of(position, ecliptic)
-
-    rahu_position = cast("float", cast("Angle", elements.longitude_of_ascending_node).degrees)
-    kethu_position = normalize_degree(rahu_position + 180)
+    rahu_position, kethu_position = _lunar_nodes_raw(given_time)
 
     declination_placeholder = 0.0
 
     return [
         PlanetDetail(
             "Rahu",
-            t(f"core.planets.planet{Planets.from_code('rahu')}")[:2],
+            Planets.to_string(Planets.RAHU)[:2],
             Angle(degrees=declination_placeholder),
             Angle(degrees=rahu_position),
             rasi_occupied=Rasis.ARIES,
             house_posited_at=Houses.HOUSE1,
-            planet=Planets.from_code("rahu"),
+            planet=Planets.RAHU,
         ),
         PlanetDetail(
             "Kethu",
-            t(f"core.planets.planet{Planets.from_code('kethu')}")[:2],
+            Planets.to_string(Planets.KETHU)[:2],
             Angle(degrees=declination_placeholder),
             Angle(degrees=kethu_position),
             rasi_occupied=Rasis.ARIES,
             house_posited_at=Houses.HOUSE1,
-            planet=Planets.from_code("kethu"),
+            planet=Planets.KETHU,
         ),
     ]
 
 
-def get_sidereal_planet_positions(lat: Angle, lon: Angle, given_time: datetime, ayanamsa: float) -> list[PlanetDetail]:
+def get_sidereal_planet_positions(
+    lat: Angle,
+    lon: Angle,
+    given_time: datetime,
+    ayanamsa: float,
+    asc_pos: PlanetDetail | None = None,
+) -> list[PlanetDetail]:
     """Return the sidereal positions of the planets.
 
     Args:
@@ -197,35 +240,54 @@ def get_sidereal_planet_positions(lat: Angle, lon: Angle, given_time: datetime,
         lon (Angle): The longitude of the observer.
         given_time (datetime): The datetime of the observation.
         ayanamsa (float): The ayanamsa value to be used for calculation.
+        asc_pos (PlanetDetail | None): The sidereal ascendant for the same inputs, if the caller already has it.
 
     Returns:
         list[PlanetDetail]: A list of sidereal positions of the planets.
 
     """
     positions = get_tropical_planetary_positions(lat, lon, given_time)
-    asc_pos = get_sidereal_ascendant_position(given_time, lat, lon, ayanamsa)
-
-    for pos in positions:
-        asc = normalize_degree(cast("float", pos.longitude.degrees) - ayanamsa)
-
-        asc_h, asc_adv_by = divmod(asc, DEGREES_PER_RAASI)
-        rasi_num = int(asc_h)
+    if asc_pos is None:
+        asc_pos = get_sidereal_ascendant_position(given_time, lat, lon, ayanamsa)
+    retrograde = batch_retrograde(
+        given_time,
+        lat,
+        lon,
+        [pos.planet.code for pos in positions if pos.planet.code not in [Planets.RAHU.code, Planets.KETHU.code]],
+    )
 
+    # Derive every planet's rasi, house, nakshatra and pada as whole arrays; the loop below only assigns the results
+    longitudes = np.array([pos.longitude.degrees for pos in positions], dtype=np.float64)
+    nirayana = np.mod(longitudes - ayanamsa, DEGREE_MAX)
+    rasi_indexes, advanced = np.divmod(nirayana, DEGREES_PER_RAASI)
+    rasi_indexes = rasi_indexes.astype(np.int64)
+
+    rasis = (np.where(advanced == 0, rasi_indexes, rasi_indexes + 1) - 1) % TOTAL_RAASI + 1
+    houses = (np.maximum(rasi_indexes, 1) + int(asc_pos.house_posited_at) - 1) % TOTAL_RAASI + 1
+
+    nakshatra_indexes = nirayana * 60.0 / _ARCMINUTES_PER_NAKSHATRA
+    remainders, wholes = np.modf(nakshatra_indexes)
+    nakshatras = np.minimum(wholes.astype(np.int64) + 1, TOTAL_NAKSHATRAS)
+    padas = np.minimum((remainders * 4).astype(np.int64) + 1, 4)
+
+    for pos, asc, rasi, house, asc_adv_by, nakshatra, pada in zip(
+        positions,
+        nirayana.tolist(),
+        rasis.tolist(),
+        houses.tolist(),
+        advanced.tolist(),
+        nakshatras.tolist(),
+        padas.tolist(),
+        strict=True,
+    ):
         pos.nirayana_longitude = Angle(degrees=asc)
-        pos.rasi_occupied = Rasis(normalize_rasi_house(rasi_num if asc_adv_by == 0 else int(rasi_num + 1)))
-        pos.house_posited_at = cast(
-            "Houses",
-            normalize_rasi_house(cast("Houses", asc_pos.house_posited_at) + Houses(rasi_num + 1 if rasi_num == 0 else rasi_num)),
-        )
+        pos.rasi_occupied = Rasis(rasi)
+        pos.house_posited_at = Houses(house)
         pos.advanced_by = Angle(degrees=asc_adv_by)
-
-        nakshatra, pada = get_nakshatra_and_pada(Angle(degrees=asc))
-        pos.natchaththiram = nakshatra
+        pos.natchaththiram = Natchaththirams(nakshatra)
         pos.paatham = pada
 
-        pos.retrograde = (
-            True if pos.planet.code in [Planets.RAHU.code, Planets.KETHU.code] else is_planet_in_retrograde(given_time, pos.planet.code, lat, lon)
-        )
+        pos.retrograde = retrograde.get(pos.planet.code, True)  # Rahu and Kethu are always retrograde
 
     positions.append(asc_pos)
 
@@ -244,23 +306,38 @@ def get_tropical_ascendant_position(given_time: datetime, lat: Angle, lon: Angle
         Angle: The longitude of the tropical ascendant.
 
     """
-    ts = load.timescale()
-    t = ts.utc(given_time)
+    oe, gmst = _time_derived(given_time)
 
-    oe = mean_obliquity(t.tdb) / 3600
-    oer = radians(oe)
+    return Angle(degrees=_ascendant_degrees(gmst, cast("float", lon.degrees), cast("float", lat.degrees), oe))
 
-    gmst: float = cast("float", t.gmst)
 
-    lst = (gmst + cast("float", lon.degrees) / 15) % 24
+@lru_cache(maxsize=256)
+def _time_derived(given_time: datetime) -> tuple[float, float]:
+    """Return the mean obliquity in degrees and the GMST in hours for the datetime, memoized as they don't depend on the location."""
+    t = _make_time(given_time)
+
+    return cast("float", mean_obliquity(t.tdb)) / 3600, cast("float", t.gmst)
+
+
+def _ascendant_degrees(gmst: float, lon_degrees: float, lat_degrees: float, obliquity: float) -> float:
+    """Return the tropical ascendant in degrees from plain floats: GMST in hours, the location, and the obliquity in degrees."""
+    oer = radians(obliquity)
+    lat_rad = radians(lat_degrees)
+
+    lst = (gmst + lon_degrees / 15) % 24
 
     lstr = radians(lst * 15)
 
-    ascr = atan2(cos(lstr), -(sin(lstr) * cos(oer) + tan(radians(cast("float", lat.degrees))) * sin(oer)))
+    # Each angle's sine and cosine are taken once
+    sin_lst, cos_lst = sin(lstr), cos(lstr)
+    sin_oe, cos_oe = sin(oer), cos(oer)
+    tan_lat = tan(lat_rad)
+
+    ascr = atan2(cos_lst, -(sin_lst * cos_oe + tan_lat * sin_oe))
 
     asc = degrees(ascr)
 
-    return Angle(degrees=normalize_degree(asc))
+    return normalize_degree(asc)
 
 
 def get_sidereal_ascendant_position(given_time: datetime, lat: Angle, lon: Angle, ayanamsa: float = AYANAMSA.LAHIRI) -> PlanetDetail:
@@ -314,27 +391,15 @@ def get_nakshatra_and_pada(longitude: Angle) -> tuple[Natchaththirams, int]:
         tuple[str, int]: The nakshatra and pada.
 
     """
-    degrees_per_nakshatra = Angle(degrees=DEGREE_MAX / TOTAL_NAKSHATRAS)
-
-    total_degrees_mins = cast("float", longitude.arcminutes())
+    total_degrees_mins = cast("float", longitude.degrees) * 60.0
 
-    nakshatra_index = total_degrees_mins / degrees_per_nakshatra.arcminutes()
+    nakshatra_index = total_degrees_mins / _ARCMINUTES_PER_NAKSHATRA
 
-    remainder = nakshatra_index - floor(nakshatra_index)
-    pada_threshold_1 = 0.25
-    pada_threshold_2 = 0.5
-    pada_threshold_3 = 0.75
+    # A longitude exactly on a boundary starts the next nakshatra; min() keeps a full 360 degrees in the last one
+    remainder, whole = modf(nakshatra_index)
+    pada = min(int(remainder * 4) + 1, 4)
 
-    if remainder < pada_threshold_1:
-        pada = 1
-    elif remainder < pada_threshold_2:
-        pada = 2
-    elif remainder < pada_threshold_3:
-        pada = 3
-    else:
-        pada = 4
-
-    nakshatra = Natchaththirams(ceil(nakshatra_index + 1 if nakshatra_index == 0 else nakshatra_index))
+    nakshatra = Natchaththirams(min(int(whole) + 1, TOTAL_NAKSHATRAS))
 
     return nakshatra, pada
 
@@ -351,15 +416,21 @@ def get_sunrise_sunset(lat: Angle, lon: Angle, given_time: datetime) -> tuple[da
         tuple[datetime, datetime]: A tuple containing the sunrise and sunset times as datetime objects.
 
     """
+    return _sunrise_sunset(cast("float", lat.degrees), cast("float", lon.degrees), given_time.date())
+
+
+@lru_cache(maxsize=512)
+def _sunrise_sunset(lat_degrees: float, lon_degrees: float, day: date) -> tuple[datetime, datetime]:
+    """Return the sunrise and sunset times at the location on the day, memoized as the search is repeated for every refresh."""
     # Define location
-    location = Topos(latitude_degrees=lat.degrees, longitude_degrees=lon.degrees)
+    location = Topos(latitude_degrees=lat_degrees, longitude_degrees=lon_degrees)
 
     # Define time range for the search (e.g., one day)
-    t_start = ts.utc(given_time.date())  # Start of the day
-    t_end = ts.utc(given_time.date() + timedelta(days=1))  # End of the day
+    t_start = ts.utc(day)  # Start of the day
+    t_end = ts.utc(day + timedelta(days=1))  # End of the day
 
     # Find sunrise time
-    f = sunrise_sunset(eph, location)
+    f = sunrise_sunset(get_eph(), location)
     times, events = find_discrete(t_start, t_end, f)
 
     sunrise, sunset = cast("list[Time]", [time for time, _ in zip(times, events)])
@@ -367,8 +438,49 @@ def get_sunrise_sunset(lat: Angle, lon: Angle, given_time: datetime) -> tuple[da
     return cast("tuple[datetime, datetime]", (sunrise.utc_datetime(), sunset.utc_datetime()))
 
 
+def get_sunrise_sunset_batch(lat: Angle, lon: Angle, given_times: Sequence[datetime]) -> list[tuple[datetime, datetime]]:
+    """Calculate the sunrise and sunset times at a location for several dates with a single search.
+
+    One search covers every day from the earliest to the latest date, and each date is given the sunrise and
+    sunset found within its own day, the same window `get_sunrise_sunset` searches.
+
+    Args:
+        lat (Angle): The latitude of the location.
+        lon (Angle): The longitude of the location.
+        given_times (Sequence[datetime]): The dates and times for which to calculate the sunrise and sunset times.
+
+    Returns:
+        list[tuple[datetime, datetime]]: The sunrise and sunset times for each of the given dates, in order.
+
+    """
+    if not given_times:
+        return []
+
+    days = [given_time.date() for given_time in given_times]
+
+    location = Topos(latitude_degrees=lat.degrees, longitude_degrees=lon.degrees)
+    t_start = ts.utc(min(days))
+    t_end = ts.utc(max(days) + timedelta(days=1))
+
+    times, _ = find_discrete(t_start, t_end, sunrise_sunset(get_eph(), location))
+    event_tt = cast("NDArray[np.float64]", times.tt)
+
+    # Each day's window holds its events from the first at or after midnight up to the next midnight
+    edges = [day + timedelta(days=offset) for day in days for offset in (0, 1)]
+    day_tt = ts.utc([edge.year for edge in edges], [edge.month for edge in edges], [edge.day for edge in edges]).tt
+    bounds = np.searchsorted(event_tt, day_tt).reshape(-1, 2).tolist()
+    event_datetimes = cast("list[datetime]", times.utc_datetime())
+
+    results: list[tuple[datetime, datetime]] = []
+    for first, end in bounds:
+        sunrise, sunset = event_datetimes[first:end]
+        results.append((sunrise, sunset))
+
+    return results
+
+
 def normalize_degree(degree: float) -> float:
-    """Normalize the degree to be within 0-360.
+    """Normalize the degree to be within [0, 360).
 
     Args:
         degree (float): The degree to normalize.
@@ -377,11 +489,7 @@ def normalize_degree(degree: float) -> float:
         float: The normalized degree.
 
     """
-    if degree < 0:
-        return DEGREE_MAX + degree
-    while degree > DEGREE_MAX:
-        degree -= DEGREE_MAX
-    return degree
+    return degree % DEGREE_MAX
 
 
 def normalize_rasi_house(position: int) -> int:
@@ -394,11 +502,7 @@ def normalize_rasi_house(position: int) -> int:
         int: The normalized rasi position.
 
     """
-    if position < 0:
-        return TOTAL_RAASI + position
-    while position > TOTAL_RAASI:
-        position -= TOTAL_RAASI
-    return position
+    return (position - 1) % TOTAL_RAASI + 1
 
 
 def get_all_planets_posited_in(rasi: Rasis, planets: list[PlanetDetail]) -> list[PlanetDetail] | None:
@@ -412,9 +516,7 @@ def get_all_planets_posited_in(rasi: Rasis, planets: list[PlanetDetail]) -> list
         list[PlanetDetail] | None: A list of planets posited in the given rasi, or None if none are found.
 
     """
-    for pos in planets:
-        pass
-    return []
+    return [pos for pos in planets if pos.rasi_occupied == rasi] or None
 
 
 def get_kattams(lat: Angle, lon: Angle, given_time: datetime) -> list[Kattam]:
@@ -431,29 +533,32 @@ def get_kattams(lat: Angle, lon: Angle, given_time: datetime) -> list[Kattam]:
     """
     ayanamsa = get_lahiri_ayanamsa(given_time)
     ascendant = get_sidereal_ascendant_position(given_time, lat, lon, ayanamsa)
-    planets = get_sidereal_planet_positions(lat, lon, given_time, ayanamsa)
+    planets = get_sidereal_planet_positions(lat, lon, given_time, ayanamsa, ascendant)
 
-    rasis_planets = {k: list(g) for k, g in groupby(sorted(planets, key=lambda x: x.rasi_occupied), lambda x: x.rasi_occupied)}
+    # One bucket per rasi, indexed by its value, keeps the planets in their original order without sorting
+    rasis_planets: list[list[PlanetDetail]] = [[] for _ in range(TOTAL_RAASI + 1)]
+    for planet in planets:
+        rasis_planets[planet.rasi_occupied].append(planet)
 
+    asc_rasi = ascendant.rasi_occupied
+
+    # Kattams are built in rasi order; the houses count from the ascendant's rasi, wrapping round past the twelfth
     kattams: list[Kattam] = []
-    rasi_list = list(range(1, TOTAL_RAASI + 1))
-    normalized_rasi_list = rasi_list[ascendant.rasi_occupied.value - 1 :] + rasi_list[: ascendant.rasi_occupied.value - 1]
-    for idx, rasi_num in enumerate(normalized_rasi_list):
+    for rasi_num in range(1, TOTAL_RAASI + 1):
         rasi = Rasis(rasi_num)
-        rp = rasis_planets.get(rasi)
+        rp = rasis_planets[rasi] or None
+        is_ascendant = asc_rasi == rasi
         kattam = Kattam(
             order=rasi_num,
             owner=cast("Planets", rasi.owner),
-            is_ascendant=ascendant.rasi_occupied == rasi,
+            is_ascendant=is_ascendant,
             planets=rp,
             rasi=rasi,
-            house=Houses(idx + 1),
-            asc_longitude=ascendant.longitude if ascendant.rasi_occupied == rasi else Angle(),
+            house=Houses((rasi_num - asc_rasi.value) % TOTAL_RAASI + 1),
+            asc_longitude=ascendant.longitude if is_ascendant else Angle(),
         )
         kattams.append(kattam)
 
-    kattams.sort(key=lambda x: x.order)
-
     return kattams
 
 
@@ -461,14 +566,12 @@ def ensure_event_loop() -> asyncio.AbstractEventLoop:
     """Ensure that an asyncio event loop is available.
 
     Returns:
-        asyncio.AbstractEventLoop: The current event loop or a new one if none exists.
+        asyncio.AbstractEventLoop: The running event loop, or a new one set as the current loop if none is running.
 
     """
     try:
-        return asyncio.get_event_loop()
-    except (AssertionError, RuntimeError):
-        asyncio.set_event_loop(asyncio.new_event_loop())
-
-    # Note: No clever tricks are used here to dry up code
-    # This avoids an infinite loop if settings the event loop ever fails
-    return asyncio.get_event_loop()
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        return loop
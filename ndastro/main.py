@@ -3,32 +3,26 @@
 import logging
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 import pytz
 from dependency_injector.wiring import Provide, inject
-from i18n import set as set_i18n_config
 from PySide6 import QtAsyncio
-from PySide6.QtCore import QFile, QTextStream
 from PySide6.QtGui import QIcon, QPixmap
 from PySide6.QtWidgets import QApplication
-from qdarkstyle import DarkPalette, LightPalette, load_stylesheet
-from skyfield.units import Angle
 
 from ndastro.app_container import AppContainer
 from ndastro.core.settings.manager import SettingsManager
 from ndastro.gui.models.ndastro_model import NDAstroModel
-from ndastro.gui.ndastro import NDAstro
+from ndastro.gui.ndastro import NDAstro, combined_stylesheet
 from ndastro.gui.views.ndastro_ui import NDAstroMainWindow
+from ndastro.libs.ephemeris import preload_eph
+from ndastro.libs.i18n_cache import configure_i18n
 from resources import *  # noqa: F403
 
-
-def _configure_i18n(basedir: Path, lang: str) -> None:
-    set_i18n_config("file_format", "json")
-    set_i18n_config("filename_format", "{namespace}.{locale}.{format}")
-    set_i18n_config("load_path", [Path.joinpath(basedir, "resources", "locales")])
-    set_i18n_config("skip_locale_root_data", value=True)
-    set_i18n_config("locale", lang)
+_BASE_DIR = Path(__file__).resolve().parent
+_LOCALES_DIR = _BASE_DIR / "resources" / "locales"
 
 
 def init(app: QApplication, settings_manager: SettingsManager, ndastro_view: NDAstroMainWindow, logger: logging.Logger) -> None:
@@ -36,17 +30,9 @@ def init(app: QApplication, settings_manager: SettingsManager, ndastro_view: NDA
     app.setApplicationName(settings_manager.get("APP", "app_name"))
     app.setApplicationVersion(settings_manager.get("APP", "app_version"))
 
-    pix = QPixmap(str(Path(settings_manager.get("APP", "app_icon")).resolve()))
-    app.setWindowIcon(QIcon(pix))
-
-    file = QFile(":/styles/core.qss")
-    file.open(QFile.OpenModeFlag.ReadOnly | QFile.OpenModeFlag.Text)
-    stream = QTextStream(file)
-    stylesheet = stream.readAll()
-    file.close()
+    app.setWindowIcon(_app_icon(settings_manager.get("APP", "app_icon")))
 
-    palette = DarkPalette if settings_manager.get("APP", "theme") == "dark" else LightPalette
-    app.setStyleSheet(load_stylesheet(qt_api="pyside6", palette=palette) + stylesheet)
+    app.setStyleSheet(combined_stylesheet(settings_manager.get("APP", "theme")))
 
     ndastro_view.show()
     logger.info("NDAstro view displayed.")
@@ -54,6 +40,12 @@ def init(app: QApplication, settings_manager: SettingsManager, ndastro_view: NDA
     QtAsyncio.run(handle_sigint=True)
 
 
+@lru_cache(maxsize=2)
+def _app_icon(icon_path: str) -> QIcon:
+    """Return the window icon decoded from the path, memoized so re-initializing the app reuses it."""
+    return QIcon(QPixmap(str(Path(icon_path).resolve())))
+
+
 @inject
 def start(
     app: QApplication,
@@ -74,7 +66,7 @@ def main() -> None:
     This function sets up the application container, initializes resources,
     configures internationalization, and starts the NDAstro application.
     """
-    base_dir = Path(__file__).resolve().parent
+    preload_eph()  # Read the ephemeris in the background while settings, i18n and the app are set up
 
     container = AppContainer()
     container.core_package.init_resources()
@@ -82,15 +74,12 @@ def main() -> None:
 
     settings_manager = container.core_package.container.settings_manager()
 
-    _configure_i18n(base_dir, settings_manager.get("APP", "language"))
-
-    latlong = settings_manager.get("APP", "location").split(",")
-    lat, lon = [float(coord) for coord in latlong]
+    configure_i18n(_LOCALES_DIR, settings_manager.get("APP", "language"))
 
     container.gui_package.container.ndastro_model.override(
         NDAstroModel(
             datetime.now(pytz.timezone(settings_manager.get("APP", "timezone"))),
-            (Angle(degrees=lat), Angle(degrees=lon)),
+            settings_manager.location_angles(),
             [("English", "en"), ("Tamil", "ta")],
             [("Light", "light"), ("Dark", "dark")],
         ),
@@ -5,12 +5,17 @@ Fixtures:
                                          if it exists, before any tests are run.
     setup(): A session-scoped fixture that sets up internationalization (i18n) configuration
              for the test session.
+    now_ist(): A session-scoped fixture that returns one "now" in Asia/Kolkata, shared by the tests
+               so they all compute for the same moment.
 """
 
+from datetime import datetime
 from pathlib import Path
 
 import pytest
-from i18n import set as set_i18n_config
+import pytz
+
+from ndastro.libs.i18n_cache import configure_i18n
 
 basedir = Path(__file__).resolve().parent.parent
 
@@ -18,19 +23,24 @@ basedir = Path(__file__).resolve().parent.parent
 @pytest.fixture(scope="session", autouse=True)
 def callattr_ahead_of_alltests(request):
     print("callattr_ahead_of_alltests called")
-    seen = {None}
+    seen: set[type] = set()
     session = request.node
     for item in session.items:
-        cls = item.getparent(pytest.Class)
-        if cls not in seen:
-            if hasattr(cls.obj, "callme"):
-                cls.obj.callme()
-            seen.add(cls)
+        # Function items carry their test class directly, so the parent chain is only walked for other items
+        cls = item.cls if hasattr(item, "cls") else getattr(item.getparent(pytest.Class), "obj", None)
+        if cls is None or cls in seen:
+            continue
+        seen.add(cls)
+        callme = getattr(cls, "callme", None)
+        if callme is not None:
+            callme()
 
 
 @pytest.fixture(scope="session", autouse=True)
 def setup() -> None:
-    set_i18n_config("file_format", "json")
-    set_i18n_config("filename_format", "{namespace}.{locale}.{format}")
-    set_i18n_config("load_path", [Path.joinpath(basedir, "ndastro", "locales")])
-    set_i18n_config("skip_locale_root_data", value=True)
+    configure_i18n(basedir / "ndastro" / "resources" / "locales")
+
+
+@pytest.fixture(scope="session")
+def now_ist() -> datetime:
+    return datetime.now(pytz.timezone("Asia/Kolkata"))
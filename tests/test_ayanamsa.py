@@ -1,5 +1,6 @@
 from datetime import datetime
 
+import pytest
 import pytz
 
 from ndastro.libs.ayanamsa import (
@@ -7,18 +8,20 @@ from ndastro.libs.ayanamsa import (
     get_days_in_julian_century,
     get_days_since_julian,
     get_lahiri_ayanamsa,
+    get_lahiri_ayanamsa_batch,
 )
 
+pytestmark = pytest.mark.slow
 
-def test_get_lahiri_ayanamsa() -> None:
-    value = get_lahiri_ayanamsa(datetime.now(pytz.timezone("Asia/Kolkata")))
+
+def test_get_lahiri_ayanamsa(now_ist: datetime) -> None:
+    value = get_lahiri_ayanamsa(now_ist)
 
     assert value is not None
 
 
 def test_days_since_julian() -> None:
     expected = 2415021.0
-    datetime.now(pytz.timezone("Asia/Kolkata"))
     days = get_days_since_julian(1900)
 
     assert days is not None
@@ -27,15 +30,26 @@ def test_days_since_julian() -> None:
 
 def test_get_days_in_julian_century() -> None:
     expected = 36524.0
-    datetime.now(pytz.timezone("Asia/Kolkata"))
     days = get_days_in_julian_century(1900, 2000)
 
     assert days is not None
     assert days == expected
 
 
-def test_calculate_b6() -> None:
-    date = datetime.now(pytz.timezone("Asia/Kolkata"))
-    b6 = calculate_b6((date.year, date.month, date.day))
+def test_calculate_b6(now_ist: datetime) -> None:
+    b6 = calculate_b6((now_ist.year, now_ist.month, now_ist.day))
 
     assert b6 is not None
+
+
+def test_get_lahiri_ayanamsa_batch() -> None:
+    dates = [datetime(1990, 3, 4, tzinfo=pytz.utc), datetime(2025, 1, 11, tzinfo=pytz.utc), datetime(2025, 6, 21, tzinfo=pytz.utc)]
+    values = get_lahiri_ayanamsa_batch(
+        [d.year for d in dates],
+        [d.month for d in dates],
+        [d.day for d in dates],
+    )
+
+    assert len(values) == len(dates)
+    for date, value in zip(dates, values, strict=True):
+        assert value == pytest.approx(get_lahiri_ayanamsa(date))
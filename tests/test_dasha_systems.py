@@ -1,10 +1,11 @@
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 
 import pytest
 import pytz
 from pytest_mock import MockerFixture
 
-from ndastro.gui.models.dasha_detail import Dashas
+from ndastro.gui.models.dasha_detail import DashaDetail, Dashas
 from ndastro.libs.custom_errors import (
     MissingPlanetsPeriodError,
     UnableToDetermineDashaError,
@@ -52,6 +53,19 @@ def test_find_running_dasha_kalachakra(dasha_system: DashaSystem):
     assert running_dasha == Planets.MARS  # Expected based on Kalachakra periods
 
 
+def test_dasha_details_compare_equal(dasha_system: DashaSystem):
+    assert dasha_system.get_vimshottari_details() == dasha_system.get_vimshottari_details()
+    assert dasha_system.get_vimshottari_details() != dasha_system.get_ashtottari_details()
+
+
+def test_dasha_details_cannot_be_reassigned(dasha_system: DashaSystem):
+    details = dasha_system.get_vimshottari_details()
+    with pytest.raises(FrozenInstanceError):
+        details.cycle_years = 108
+    assert details.cycle_days == 120 * 365
+    assert int(details.period_ends[-1]) == sum(details.period_days)
+
+
 def test_find_running_dasha_unsupported_system(dasha_system: DashaSystem):
     birth_datetime = datetime(1990, 1, 1, tzinfo=pytz.utc)
     current_datetime = datetime(2020, 1, 1, tzinfo=pytz.utc)
@@ -63,12 +77,13 @@ def test_find_running_dasha_unsupported_system(dasha_system: DashaSystem):
         )
 
 
-def test_find_running_dasha_missing_planets_period(dasha_system: DashaSystem, mocker: MockerFixture):
+def test_find_running_dasha_missing_planets_period(mocker: MockerFixture):
     mocker.patch.object(
-        dasha_system,
+        DashaSystem,
         "get_vimshottari_details",
-        return_value=mocker.Mock(planets_period=None),
+        return_value=DashaDetail(name="Vimshottari", dasha_system=Dashas.VIMSHOTTARI, cycle_years=120, planets_period=None),
     )
+    dasha_system = DashaSystem()
     birth_datetime = datetime(1990, 1, 1, tzinfo=pytz.utc)
     current_datetime = datetime(2020, 1, 1, tzinfo=pytz.utc)
     with pytest.raises(MissingPlanetsPeriodError):
@@ -79,12 +94,13 @@ def test_find_running_dasha_missing_planets_period(dasha_system: DashaSystem, mo
         )
 
 
-def test_find_running_dasha_unable_to_determine(dasha_system: DashaSystem, mocker):
+def test_find_running_dasha_unable_to_determine(mocker: MockerFixture):
     mocker.patch.object(
-        dasha_system,
+        DashaSystem,
         "get_vimshottari_details",
-        return_value=mocker.Mock(planets_period={Planets.SUN: 5}),
+        return_value=DashaDetail(name="Vimshottari", dasha_system=Dashas.VIMSHOTTARI, cycle_years=120, planets_period={Planets.SUN: 5}),
     )
+    dasha_system = DashaSystem()
     birth_datetime = datetime(1990, 1, 1, tzinfo=pytz.utc)
     current_datetime = datetime(2020, 1, 1, tzinfo=pytz.utc)
     with pytest.raises(UnableToDetermineDashaError):
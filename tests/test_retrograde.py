@@ -1,9 +1,17 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
+import pytest
 import pytz
 from skyfield.units import Angle
 
-from ndastro.libs.retrograde import is_planet_in_retrograde
+from ndastro.libs.retrograde import (
+    _find_retrograde_periods_around,
+    batch_retrograde,
+    find_retrograde_periods,
+    is_planet_in_retrograde,
+)
+
+pytestmark = pytest.mark.slow
 
 
 def test_is_planet_in_retrograde_true():
@@ -44,3 +52,41 @@ def test_is_planet_in_retrograde_invalid_date():
     latitude = Angle(degrees=12.59)
     longitude = Angle(degrees=77.35)
     assert is_planet_in_retrograde(check_date, planet_name, latitude, longitude) is False
+
+
+def test_batch_retrograde_matches_find_retrograde_periods():
+    check_date = datetime(2025, 4, 1, tzinfo=pytz.timezone("Asia/Kolkata"))
+    latitude = Angle(degrees=12.59)
+    longitude = Angle(degrees=77.35)
+    # uranus is not one of the planets on the shared grid, so it goes through the single-planet fallback
+    planet_names = ["venus", "mercury", "mars barycenter", "uranus barycenter"]
+    flags = batch_retrograde(check_date, latitude, longitude, ["sun", *planet_names])
+
+    expected = {}
+    for name in planet_names:
+        periods = find_retrograde_periods(check_date - timedelta(days=365), check_date + timedelta(days=365), name, 12.59, 77.35)
+        expected[name] = any(start <= check_date <= end for start, end in periods)
+    assert flags == {"sun": False, **expected}
+    assert flags["venus"] is True
+
+
+@pytest.mark.parametrize("check_date", [datetime(1900, 10, 1, tzinfo=pytz.utc), datetime(2052, 3, 1, tzinfo=pytz.utc)])
+def test_retrograde_periods_near_ephemeris_limits(check_date: datetime):
+    # The year window is clamped to the ephemeris, so it agrees with a plain year either side of the date
+    for planet_name in ["venus", "jupiter barycenter"]:
+        periods = _find_retrograde_periods_around(check_date.year, planet_name, 12.59, 77.35)
+        expected = find_retrograde_periods(check_date - timedelta(days=365), check_date + timedelta(days=365), planet_name, 12.59, 77.35)
+        assert any(start <= check_date <= end for start, end in periods) == any(start <= check_date <= end for start, end in expected)
+
+
+@pytest.mark.parametrize(
+    ("check_date", "retrograde_planets"),
+    [
+        (datetime(1900, 10, 1, tzinfo=pytz.utc), set()),
+        (datetime(2052, 3, 1, tzinfo=pytz.utc), {"jupiter barycenter"}),
+    ],
+)
+def test_batch_retrograde_near_ephemeris_limits(check_date: datetime, retrograde_planets: set[str]):
+    planet_names = ["venus", "mercury", "mars barycenter", "jupiter barycenter", "saturn barycenter"]
+    flags = batch_retrograde(check_date, Angle(degrees=12.59), Angle(degrees=77.35), planet_names)
+    assert {name for name, retrograde in flags.items() if retrograde} == retrograde_planets
@@ -7,24 +7,33 @@ import pytest
 import pytz
 from skyfield.units import Angle
 
+from ndastro.gui.models.planet_position import PlanetDetail
 from ndastro.libs.ayanamsa import get_lahiri_ayanamsa
 from ndastro.libs.constants import AYANAMSA
+from ndastro.libs.house_enum import Houses
 from ndastro.libs.nakshatra_enum import Natchaththirams
 from ndastro.libs.planet_enum import Planets
+from ndastro.libs.rasi_enum import Rasis
 from ndastro.libs.utils import (
     calculate_lunar_nodes,
     dms_to_decimal,
+    get_all_planets_posited_in,
     get_kattams,
     get_nakshatra_and_pada,
     get_sidereal_ascendant_position,
     get_sidereal_planet_positions,
     get_sunrise_sunset,
+    get_sunrise_sunset_batch,
     get_tropical_ascendant_position,
     get_tropical_planetary_positions,
     get_tropical_position_of,
     is_planet_in_retrograde,
+    normalize_degree,
+    normalize_rasi_house,
 )
 
+pytestmark = pytest.mark.slow
+
 
 def test_dms_to_decimal() -> None:
     degrees, minutes, seconds = 13, 20, 0
@@ -53,12 +62,12 @@ def test_position_of() -> None:
     print("Moon position is {lon}", cast("float", lon.degrees) - 24 % 360)
 
 
-def test_get_tropical_planetary_positions() -> None:
+def test_get_tropical_planetary_positions(now_ist: datetime) -> None:
     latitude, longitude = 12.9716, 77.5946  # Bengaluru, India
     planet_pos = get_tropical_planetary_positions(
         Angle(degrees=latitude),
         Angle(degrees=longitude),
-        datetime.now(pytz.timezone("Asia/Kolkata")),
+        now_ist,
     )
 
     assert planet_pos is not None
@@ -67,13 +76,13 @@ def test_get_tropical_planetary_positions() -> None:
         print(f"The {pos.name}'s position is: {(cast('float', pos.longitude.degrees) - AYANAMSA.LAHIRI) % 360}")
 
 
-def test_get_sidereal_planetary_positions() -> None:
+def test_get_sidereal_planetary_positions(now_ist: datetime) -> None:
     latitude, longitude = 12.59, 77.35  # Bengaluru, India
     planet_pos = get_sidereal_planet_positions(
         Angle(degrees=latitude),
         Angle(degrees=longitude),
-        datetime.now(pytz.timezone("Asia/Kolkata")),
-        get_lahiri_ayanamsa(datetime.now(pytz.timezone("Asia/Kolkata"))),
+        now_ist,
+        get_lahiri_ayanamsa(now_ist),
     )
 
     assert planet_pos is not None
@@ -89,8 +98,8 @@ def test_get_sidereal_planetary_positions() -> None:
         )
 
 
-def test_calculate_lunar_nodes() -> None:
-    rahu, kethu = calculate_lunar_nodes(datetime.now(pytz.timezone("Asia/Kolkata")))
+def test_calculate_lunar_nodes(now_ist: datetime) -> None:
+    rahu, kethu = calculate_lunar_nodes(now_ist)
 
     assert rahu.name == "rahu"
     assert kethu.name == "kethu"
@@ -98,14 +107,14 @@ def test_calculate_lunar_nodes() -> None:
     print(kethu.longitude.degrees)
 
 
-def test_get_tropical_ascendant_position() -> None:
-    pos = get_tropical_ascendant_position(datetime.now(pytz.timezone("Asia/Kolkata")), Angle(degrees=12.59), Angle(degrees=77.35))
+def test_get_tropical_ascendant_position(now_ist: datetime) -> None:
+    pos = get_tropical_ascendant_position(now_ist, Angle(degrees=12.59), Angle(degrees=77.35))
     house = cast("float", pos.degrees) // 30
     print(f"Ascendant is in {house}th rasi {pos.dstr()} {pos.dms()}")
 
 
-def test_get_sidereal_ascendant_position() -> None:
-    pos = get_sidereal_ascendant_position(datetime.now(pytz.timezone("Asia/Kolkata")), Angle(degrees=12.59), Angle(degrees=77.35))
+def test_get_sidereal_ascendant_position(now_ist: datetime) -> None:
+    pos = get_sidereal_ascendant_position(now_ist, Angle(degrees=12.59), Angle(degrees=77.35))
     a = Angle(degrees=103.56)
     print(f"The DMS = {a.dstr(format='{0}{1}°{2:02}\'{3:02}.{4:0{5}}"')}")
     rasi_occupied_str = str(pos.rasi_occupied) if pos.rasi_occupied is not None else "Unknown"
@@ -115,10 +124,12 @@ def test_get_sidereal_ascendant_position() -> None:
 @pytest.mark.parametrize(
     ("degrees", "expected_nakshatra", "expected_pada"),
     [
+        (0, Natchaththirams.ASWINNI, 1),
         (5, Natchaththirams.ASWINNI, 2),
         (13.3333334, Natchaththirams.BHARANI, 1),
         (26.6667, Natchaththirams.KAARTHIKAI, 1),
         (30, Natchaththirams.KAARTHIKAI, 2),
+        (40, Natchaththirams.ROGHINI, 1),
         (359.4, Natchaththirams.REVATHI, 4),
         (180, Natchaththirams.CHITHTHIRAI, 3),
         (270, Natchaththirams.UTHTHIRAADAM, 2),
@@ -130,6 +141,22 @@ def test_get_nakshatra_and_pada(degrees: float, expected_nakshatra: Natchaththir
     assert pada == expected_pada, f"Expected {expected_pada}, but got {pada}"
 
 
+@pytest.mark.parametrize(
+    ("degree", "expected"),
+    [(-10, 350), (0, 0), (360, 0), (370, 10), (725.5, 5.5), (-370, 350)],
+)
+def test_normalize_degree(degree: float, expected: float) -> None:
+    assert normalize_degree(degree) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    ("position", "expected"),
+    [(-3, 9), (0, 12), (1, 1), (12, 12), (13, 1), (24, 12), (25, 1)],
+)
+def test_normalize_rasi_house(position: int, expected: int) -> None:
+    assert normalize_rasi_house(position) == expected
+
+
 @pytest.mark.parametrize(
     ("planet", "given_time", "expected"),
     [
@@ -165,6 +192,23 @@ def test_get_sunrise_sunset(latitude: float, longitude: float, given_time: datet
     print(f"Location ({latitude}, {longitude}) - Sunrise: {sunrise_str}, Sunset: {sunset_str}")
 
 
+def test_get_sunrise_sunset_batch() -> None:
+    latitude, longitude = Angle(degrees=12.59), Angle(degrees=77.35)  # Bengaluru, India
+    given_times = [
+        datetime(2025, 1, 11, tzinfo=pytz.timezone("Asia/Kolkata")),
+        datetime(2025, 6, 21, tzinfo=pytz.timezone("Asia/Kolkata")),
+        datetime(2025, 12, 25, tzinfo=pytz.timezone("Asia/Kolkata")),
+    ]
+
+    results = get_sunrise_sunset_batch(latitude, longitude, given_times)
+
+    assert len(results) == len(given_times)
+    for given_time, (sunrise, sunset) in zip(given_times, results, strict=True):
+        expected_sunrise, expected_sunset = get_sunrise_sunset(latitude, longitude, given_time)
+        assert abs((sunrise - expected_sunrise).total_seconds()) < 1
+        assert abs((sunset - expected_sunset).total_seconds()) < 1
+
+
 @pytest.mark.parametrize(
     ("latitude", "longitude", "given_time"),
     [
@@ -182,3 +226,14 @@ def test_get_kattams(latitude: float, longitude: float, given_time: datetime) ->
     for kattam in kattams:
         assert hasattr(kattam, "name"), "Each Kattam should have a 'name' attribute"
         print(f"Kattam: {kattam.order}")
+
+
+def test_get_all_planets_posited_in() -> None:
+    planets = [
+        PlanetDetail("Sun", "Su", Angle(degrees=0), Angle(degrees=10), Rasis.ARIES, Houses.HOUSE1, Planets.SUN),
+        PlanetDetail("Moon", "Mo", Angle(degrees=0), Angle(degrees=40), Rasis.TAURUS, Houses.HOUSE2, Planets.MOON),
+        PlanetDetail("Mars", "Ma", Angle(degrees=0), Angle(degrees=20), Rasis.ARIES, Houses.HOUSE1, Planets.MARS),
+    ]
+
+    assert get_all_planets_posited_in(Rasis.ARIES, planets) == [planets[0], planets[2]]
+    assert get_all_planets_posited_in(Rasis.GEMINI, planets) is None